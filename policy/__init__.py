@@ -1,5 +1,13 @@
 from policy.models import Policy
 from policy.regulations import RegulatoryRegistry
-from policy.green_cross import green_cross_policy, registry
 
 __all__ = ["Policy", "RegulatoryRegistry", "green_cross_policy", "registry"]
+
+
+def __getattr__(name: str):
+    # green_cross_policy and registry are built on first access; re-export
+    # them lazily too
+    if name in ("green_cross_policy", "registry"):
+        from policy import green_cross
+        return getattr(green_cross, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
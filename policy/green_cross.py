@@ -2,11 +2,32 @@
 
 Every value here traces back to contracts/green-cross-policy.md.
 Tests assert against this data to verify platform compliance.
+
+`green_cross_policy` and `registry` are built on first attribute access
+(PEP 562); importing this module only executes function definitions. A
+pre-fork server can touch `green_cross_policy` once in the parent so workers
+share the built tree copy-on-write.
+
+Each top-level section has its own memoized builder, exposed the same way:
+`from policy.green_cross import pharmacy` builds only the pharmacy tree.
+
+The built tree is dumped as JSON under __pycache__ and later processes load
+it through pydantic-core's JSON validator until any module in the policy
+package or the regulations JSONL changes. This module stays the audited source.
 """
 
+import hashlib
+import os
+from contextlib import suppress
+from dataclasses import is_dataclass
 from datetime import date
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
+from typing import TypeVar
+
+import pydantic
+from pydantic import TypeAdapter
 
 from policy.models import (
     AccumulatorAdjustment,
@@ -57,218 +78,329 @@ from policy.models import (
     VisionBenefits,
     VisionHardware,
     VisitLimit,
+    VisitLimitGroup,
 )
-from policy.regulations import RegulatoryRegistry
+from policy.regulations import DEFAULT_REGULATIONS_PATH, default_registry
 
 
 # ---------------------------------------------------------------------------
-# Load regulatory references from JSONL
+# Literal helpers
 # ---------------------------------------------------------------------------
 
-_REGULATIONS_PATH = Path(__file__).parent.parent / "regulations" / "base_policies.jsonl"
-registry = RegulatoryRegistry.from_jsonl(_REGULATIONS_PATH)
+M = TypeVar("M")
+
+
+@lru_cache(maxsize=None)
+def _D(value: str) -> Decimal:
+    """Decimal literal, parsed once per distinct value and shared thereafter."""
+    return Decimal(value)
+
+
+_VALIDATE = os.environ.get("GREEN_CROSS_VALIDATE") == "1"
+
+
+_ATOMS = (str, int, Decimal, date, type(None))
+_INTERNED: dict[tuple, object] = {}
+
+
+def _new(cls: type[M], **fields) -> M:
+    """Instantiate a contract model from the hand-authored literals below.
+
+    Leaf records (CostShare, DeductibleTier, RxTier, ...) are pydantic
+    dataclasses and are validated strictly on every build; they carry most
+    of the money fields. The models above them are trusted
+    (`model_construct`) unless GREEN_CROSS_VALIDATE=1 is set. The test suite
+    sets it, so typos and type errors anywhere in this file fail loudly.
+
+    Objects built only from scalar fields are interned: a repeated shape
+    (the same copay CostShare in two sections, say) returns the one frozen
+    instance already built.
+    """
+    if all(isinstance(v, _ATOMS) for v in fields.values()):
+        # repr() keeps Decimal("0.2") and Decimal("0.20") apart
+        key = (cls, tuple(sorted((k, repr(v)) for k, v in fields.items())))
+        obj = _INTERNED.get(key)
+        if obj is None:
+            obj = _INTERNED[key] = _build(cls, fields)
+        return obj
+    return _build(cls, fields)
+
+
+def _build(cls: type[M], fields: dict) -> M:
+    if is_dataclass(cls):
+        return cls(**fields)  # contract_leaf: always validated, strictly
+    if _VALIDATE:
+        return cls(**fields)
+    return cls.model_construct(**fields)
 
 
 # ---------------------------------------------------------------------------
-# Policy instance
+# Shared shapes
+# ---------------------------------------------------------------------------
+
+_PLAN_YEAR_START = date(2025, 1, 1)
+_PLAN_YEAR_END = date(2025, 12, 31)
+
+# every step-therapy rule offers the same override path (§9.3)
+_STD_STEP_OVERRIDES = frozenset({"adverse_reaction", "contraindication", "therapeutic_failure"})
+
+
+# Cost-share shapes repeated across sections. _new interns them, so every
+# section that uses one shares a single frozen instance.
+
+def _oon_after_deductible() -> CostShare:
+    return _new(CostShare, coinsurance=_D("0.40"), subject_to_deductible=True)
+
+
+def _oon_not_covered() -> CostShare:
+    return _new(CostShare, covered=False)
+
+
+def _in_network_inpatient() -> InpatientCostShare:
+    return _new(
+        InpatientCostShare,
+        facility_copay=_D("500"),
+        facility_coinsurance=_D("0.20"),
+        physician_coinsurance=_D("0.20"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Deductibles  (§1)
 # ---------------------------------------------------------------------------
 
-green_cross_policy = Policy(
-    plan_name="Green Cross PPO Select",
-    policy_number="GCX-2025-PPO-4417",
-    group_number="GCX-00382",
-    effective_date=date(2025, 1, 1),
-    plan_year_start=date(2025, 1, 1),
-    plan_year_end=date(2025, 12, 31),
-    plan_type=PlanType.PPO,
-    sbc_version="2025-R3",
-    base_policies=registry.all(),
-
-    # ------------------------------------------------------------------
-    # Deductibles  (§1)
-    # ------------------------------------------------------------------
-    deductibles=Deductibles(
-        in_network=DeductibleTier(
-            individual=Decimal("1500"),
-            family=Decimal("3000"),
+@lru_cache(maxsize=1)
+def _build_deductibles() -> Deductibles:
+    return _new(
+        Deductibles,
+        in_network=_new(
+            DeductibleTier,
+            individual=_D("1500"),
+            family=_D("3000"),
             type=DeductibleType.EMBEDDED,
         ),
-        out_of_network=DeductibleTier(
-            individual=Decimal("3000"),
-            family=Decimal("6000"),
+        out_of_network=_new(
+            DeductibleTier,
+            individual=_D("3000"),
+            family=_D("6000"),
             type=DeductibleType.NON_EMBEDDED,
         ),
         cross_accumulation=False,
-        excluded_services=[
+        excluded_services=(
             "preventive_care_in_network",
             "pediatric_well_child_in_network",
             "telehealth_pcp_in_network",
             "tier1_preventive_rx",
-        ],
-    ),
-
-    # ------------------------------------------------------------------
-    # Out-of-pocket maximum  (§2)
-    # ------------------------------------------------------------------
-    oop_max=OutOfPocketMax(
-        in_network=OOPMaxTier(individual=Decimal("4500"), family=Decimal("9000")),
-        out_of_network=OOPMaxTier(individual=Decimal("9000"), family=Decimal("18000")),
-        includes=["deductible", "copayments", "coinsurance"],
-        excludes=[
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Out-of-pocket maximum  (§2)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_oop_max() -> OutOfPocketMax:
+    return _new(
+        OutOfPocketMax,
+        in_network=_new(OOPMaxTier, individual=_D("4500"), family=_D("9000")),
+        out_of_network=_new(OOPMaxTier, individual=_D("9000"), family=_D("18000")),
+        includes=("deductible", "copayments", "coinsurance"),
+        excludes=(
             "premiums",
             "balance_billed_charges",
             "non_covered_services",
             "prior_auth_penalties",
-        ],
-        accumulator_adjustment=AccumulatorAdjustment(
+        ),
+        accumulator_adjustment=_new(
+            AccumulatorAdjustment,
             enabled=True,
             excluded_from_deductible=True,
             excluded_from_oop=True,
-            applies_to_tiers=[3, 4],
+            applies_to_tiers=(3, 4),
         ),
-    ),
+    )
+
 
-    # ------------------------------------------------------------------
-    # Preventive care  (§4)
-    # ------------------------------------------------------------------
-    preventive_care=PreventiveCare(
-        base_policies=registry.statutes_for("preventive_care"),
-        services=[
-            PreventiveService(
+# ---------------------------------------------------------------------------
+# Preventive care  (§4)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_preventive_care() -> PreventiveCare:
+    return _new(
+        PreventiveCare,
+        base_policies=tuple(default_registry().statutes_for("preventive_care")),
+        services=(
+            _new(
+                PreventiveService,
                 name="annual_physical",
                 frequency_per_plan_year=1,
                 frequency_description="1 per plan year",
                 age_min=18,
                 notes="Must use PCP or designated wellness provider",
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="well_woman_exam",
                 frequency_per_plan_year=1,
                 frequency_description="1 per plan year",
                 age_min=18,
                 gender=Gender.FEMALE,
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="pediatric_well_child",
                 frequency_description="Per AAP Bright Futures schedule",
                 age_max=17,
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="routine_immunizations",
                 frequency_description="Per CDC schedule",
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="screening_colonoscopy",
                 frequency_description="1 per 10 years",
                 age_min=45,
                 notes="Diagnostic colonoscopy subject to deductible + coinsurance",
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="screening_mammogram",
                 frequency_per_plan_year=1,
                 frequency_description="1 per plan year",
                 age_min=40,
                 gender=Gender.FEMALE,
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="dental_cleaning",
                 frequency_per_plan_year=2,
                 frequency_description="2 per plan year",
                 notes="Prophylaxis only; periodontal maintenance is NOT preventive",
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="dental_exam",
                 frequency_per_plan_year=2,
                 frequency_description="2 per plan year",
                 notes="Includes bitewing X-rays 1x/year",
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="routine_vision_exam",
                 frequency_per_plan_year=1,
                 frequency_description="1 per plan year",
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="psa_screening",
                 frequency_per_plan_year=1,
                 frequency_description="1 per plan year",
                 age_min=55,
                 gender=Gender.MALE,
             ),
-            PreventiveService(
+            _new(
+                PreventiveService,
                 name="cervical_cancer_screening",
                 frequency_description="Per USPSTF schedule",
                 age_min=21,
                 age_max=65,
                 gender=Gender.FEMALE,
             ),
-        ],
-        reclassification_rules=[
-            PreventiveToDiagnosticRule(
+        ),
+        reclassification_rules=(
+            _new(
+                PreventiveToDiagnosticRule,
                 trigger="polyp_removal_during_screening_colonoscopy",
-                preventive_portion_cost=Decimal("0"),
-                diagnostic_portion=CostShare(
-                    coinsurance=Decimal("0.20"),
+                preventive_portion_cost=_D("0"),
+                diagnostic_portion=_new(
+                    CostShare,
+                    coinsurance=_D("0.20"),
                     subject_to_deductible=True,
                 ),
             ),
-            PreventiveToDiagnosticRule(
+            _new(
+                PreventiveToDiagnosticRule,
                 trigger="new_diagnosis_during_annual_physical",
-                preventive_portion_cost=Decimal("0"),
-                diagnostic_portion=CostShare(
-                    copay=Decimal("30"),
+                preventive_portion_cost=_D("0"),
+                diagnostic_portion=_new(
+                    CostShare,
+                    copay=_D("30"),
                     subject_to_deductible=False,
                 ),
             ),
-        ],
+        ),
         split_billing_allowed=True,
-    ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Primary care  (§5.1)
+# ---------------------------------------------------------------------------
 
-    # ------------------------------------------------------------------
-    # Primary care  (§5.1)
-    # ------------------------------------------------------------------
-    primary_care=[
-        ServiceBenefit(
+@lru_cache(maxsize=1)
+def _build_primary_care() -> tuple[ServiceBenefit, ...]:
+    return (
+        _new(
+            ServiceBenefit,
             name="pcp_office_visit",
-            in_network=CostShare(copay=Decimal("30"), subject_to_deductible=False),
-            out_of_network=CostShare(coinsurance=Decimal("0.40"), subject_to_deductible=True),
+            in_network=_new(CostShare, copay=_D("30"), subject_to_deductible=False),
+            out_of_network=_oon_after_deductible(),
         ),
-        ServiceBenefit(
+        _new(
+            ServiceBenefit,
             name="telehealth_pcp",
-            in_network=CostShare(copay=Decimal("10"), subject_to_deductible=False),
-            out_of_network=CostShare(covered=False),
+            in_network=_new(CostShare, copay=_D("10"), subject_to_deductible=False),
+            out_of_network=_oon_not_covered(),
         ),
-        ServiceBenefit(
+        _new(
+            ServiceBenefit,
             name="after_hours_pcp",
-            in_network=CostShare(copay=Decimal("45"), subject_to_deductible=False),
-            out_of_network=CostShare(coinsurance=Decimal("0.40"), subject_to_deductible=True),
+            in_network=_new(CostShare, copay=_D("45"), subject_to_deductible=False),
+            out_of_network=_oon_after_deductible(),
         ),
-    ],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Specialist care  (§5.2)
+# ---------------------------------------------------------------------------
 
-    # ------------------------------------------------------------------
-    # Specialist care  (§5.2)
-    # ------------------------------------------------------------------
-    specialist_care=[
-        ServiceBenefit(
+@lru_cache(maxsize=1)
+def _build_specialist_care() -> tuple[ServiceBenefit, ...]:
+    return (
+        _new(
+            ServiceBenefit,
             name="specialist_office_visit",
-            in_network=CostShare(copay=Decimal("60"), subject_to_deductible=False),
-            out_of_network=CostShare(coinsurance=Decimal("0.40"), subject_to_deductible=True),
+            in_network=_new(CostShare, copay=_D("60"), subject_to_deductible=False),
+            out_of_network=_oon_after_deductible(),
         ),
-        ServiceBenefit(
+        _new(
+            ServiceBenefit,
             name="telehealth_specialist",
-            in_network=CostShare(copay=Decimal("45"), subject_to_deductible=False),
-            out_of_network=CostShare(covered=False),
-        ),
-    ],
-
-    # ------------------------------------------------------------------
-    # Emergency care  (§6)
-    # ------------------------------------------------------------------
-    emergency=EmergencyCare(
-        base_policies=registry.statutes_for("emergency"),
-        er=ERBenefit(
-            facility_copay=Decimal("350"),
-            facility_coinsurance=Decimal("0.20"),
-            physician_coinsurance=Decimal("0.20"),
+            in_network=_new(CostShare, copay=_D("45"), subject_to_deductible=False),
+            out_of_network=_oon_not_covered(),
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Emergency care  (§6)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_emergency() -> EmergencyCare:
+    return _new(
+        EmergencyCare,
+        base_policies=tuple(default_registry().statutes_for("emergency")),
+        er=_new(
+            ERBenefit,
+            facility_copay=_D("350"),
+            facility_coinsurance=_D("0.20"),
+            physician_coinsurance=_D("0.20"),
             subject_to_deductible=True,
             copay_waived_if_admitted=True,
             admission_window_hours=24,
@@ -276,284 +408,328 @@ green_cross_policy = Policy(
             oon_covered_at_in_network_rates=True,
             post_stabilization_oon_applies=True,
         ),
-        urgent_care=ServiceBenefit(
+        urgent_care=_new(
+            ServiceBenefit,
             name="urgent_care",
-            in_network=CostShare(copay=Decimal("75"), subject_to_deductible=False),
-            out_of_network=CostShare(coinsurance=Decimal("0.40"), subject_to_deductible=True),
-        ),
-        ambulance=AmbulanceBenefit(
-            ground_copay=Decimal("300"),
-            ground_coinsurance=Decimal("0.20"),
-            air_copay=Decimal("500"),
-            air_coinsurance=Decimal("0.20"),
+            in_network=_new(CostShare, copay=_D("75"), subject_to_deductible=False),
+            out_of_network=_oon_after_deductible(),
+        ),
+        ambulance=_new(
+            AmbulanceBenefit,
+            ground_copay=_D("300"),
+            ground_coinsurance=_D("0.20"),
+            air_copay=_D("500"),
+            air_coinsurance=_D("0.20"),
             subject_to_deductible=True,
             non_emergency_prior_auth=True,
         ),
-    ),
+    )
 
-    # ------------------------------------------------------------------
-    # Inpatient care  (§7)
-    # ------------------------------------------------------------------
-    inpatient=InpatientCare(
-        base_policies=registry.statutes_for("inpatient"),
-        in_network=InpatientCostShare(
-            facility_copay=Decimal("500"),
-            facility_coinsurance=Decimal("0.20"),
-            physician_coinsurance=Decimal("0.20"),
-        ),
-        out_of_network=InpatientCostShare(
-            facility_copay=Decimal("0"),
-            facility_coinsurance=Decimal("0.40"),
-            physician_coinsurance=Decimal("0.40"),
+
+# ---------------------------------------------------------------------------
+# Inpatient care  (§7)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_inpatient() -> InpatientCare:
+    return _new(
+        InpatientCare,
+        base_policies=tuple(default_registry().statutes_for("inpatient")),
+        in_network=_in_network_inpatient(),
+        out_of_network=_new(
+            InpatientCostShare,
+            facility_copay=_D("0"),
+            facility_coinsurance=_D("0.40"),
+            physician_coinsurance=_D("0.40"),
         ),
         prior_auth_required=True,
-        prior_auth_penalty=Decimal("500"),
+        prior_auth_penalty=_D("500"),
         prior_auth_penalty_counts_toward_oop=False,
-        observation_status=ObservationStatus(
+        observation_status=_new(
+            ObservationStatus,
             uses_outpatient_benefits=True,
             er_copay_waived=False,
             notes="Observation status does NOT trigger inpatient benefits; ER copay NOT waived",
         ),
-        maternity_in_network=InpatientCostShare(
-            facility_copay=Decimal("500"),
-            facility_coinsurance=Decimal("0.20"),
-            physician_coinsurance=Decimal("0.20"),
-        ),
+        maternity_in_network=_in_network_inpatient(),
         min_stay_vaginal_hours=48,
         min_stay_cesarean_hours=96,
         snf_in_network_days_per_year=60,
         snf_out_of_network_days_per_year=30,
-    ),
-
-    # ------------------------------------------------------------------
-    # Mental health  (§8)
-    # ------------------------------------------------------------------
-    mental_health=MentalHealthBenefits(
-        base_policies=registry.statutes_for("mental_health"),
-        outpatient_individual=ServiceBenefit(
+    )
+
+
+# ---------------------------------------------------------------------------
+# Mental health  (§8)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_mental_health() -> MentalHealthBenefits:
+    return _new(
+        MentalHealthBenefits,
+        base_policies=tuple(default_registry().statutes_for("mental_health")),
+        outpatient_individual=_new(
+            ServiceBenefit,
             name="individual_therapy",
-            in_network=CostShare(copay=Decimal("30"), subject_to_deductible=False),
-            out_of_network=CostShare(coinsurance=Decimal("0.40"), subject_to_deductible=True),
+            in_network=_new(CostShare, copay=_D("30"), subject_to_deductible=False),
+            out_of_network=_oon_after_deductible(),
         ),
-        outpatient_group=ServiceBenefit(
+        outpatient_group=_new(
+            ServiceBenefit,
             name="group_therapy",
-            in_network=CostShare(copay=Decimal("15"), subject_to_deductible=False),
-            out_of_network=CostShare(coinsurance=Decimal("0.40"), subject_to_deductible=True),
+            in_network=_new(CostShare, copay=_D("15"), subject_to_deductible=False),
+            out_of_network=_oon_after_deductible(),
         ),
-        psychiatric_med_mgmt=ServiceBenefit(
+        psychiatric_med_mgmt=_new(
+            ServiceBenefit,
             name="psychiatric_med_mgmt",
-            in_network=CostShare(copay=Decimal("60"), subject_to_deductible=False),
-            out_of_network=CostShare(coinsurance=Decimal("0.40"), subject_to_deductible=True),
+            in_network=_new(CostShare, copay=_D("60"), subject_to_deductible=False),
+            out_of_network=_oon_after_deductible(),
         ),
-        telehealth=ServiceBenefit(
+        telehealth=_new(
+            ServiceBenefit,
             name="telehealth_therapy",
-            in_network=CostShare(copay=Decimal("10"), subject_to_deductible=False),
-            out_of_network=CostShare(covered=False),
-        ),
-        inpatient=InpatientCostShare(
-            facility_copay=Decimal("500"),
-            facility_coinsurance=Decimal("0.20"),
-            physician_coinsurance=Decimal("0.20"),
+            in_network=_new(CostShare, copay=_D("10"), subject_to_deductible=False),
+            out_of_network=_oon_not_covered(),
         ),
+        inpatient=_in_network_inpatient(),
         parity_compliant=True,
         separate_visit_limits=False,
         separate_day_limits=False,
         higher_cost_share_than_medical=False,
-    ),
-
-    # ------------------------------------------------------------------
-    # Pharmacy  (§9)
-    # ------------------------------------------------------------------
-    pharmacy=PharmacyBenefits(
-        tiers=[
-            RxTier(tier=1, name="Preferred generic",
-                   retail_30day_copay=Decimal("10"), mail_90day_copay=Decimal("25")),
-            RxTier(tier=2, name="Non-preferred generic",
-                   retail_30day_copay=Decimal("30"), mail_90day_copay=Decimal("75")),
-            RxTier(tier=3, name="Preferred brand",
-                   retail_30day_copay=Decimal("60"), mail_90day_copay=Decimal("150")),
-            RxTier(tier=4, name="Non-preferred brand",
-                   retail_30day_copay=Decimal("100"), mail_90day_copay=Decimal("250")),
-            RxTier(tier=5, name="Specialty",
-                   retail_30day_coinsurance=Decimal("0.30"),
-                   retail_30day_max_per_fill=Decimal("350"),
-                   mail_90day_available=False),
-        ],
-        step_therapy=[
-            StepTherapyRule(
+    )
+
+
+# ---------------------------------------------------------------------------
+# Pharmacy  (§9)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_pharmacy() -> PharmacyBenefits:
+    return _new(
+        PharmacyBenefits,
+        tiers=(
+            _new(RxTier, tier=1, name="Preferred generic",
+                 retail_30day_copay=_D("10"), mail_90day_copay=_D("25")),
+            _new(RxTier, tier=2, name="Non-preferred generic",
+                 retail_30day_copay=_D("30"), mail_90day_copay=_D("75")),
+            _new(RxTier, tier=3, name="Preferred brand",
+                 retail_30day_copay=_D("60"), mail_90day_copay=_D("150")),
+            _new(RxTier, tier=4, name="Non-preferred brand",
+                 retail_30day_copay=_D("100"), mail_90day_copay=_D("250")),
+            _new(RxTier, tier=5, name="Specialty",
+                 retail_30day_coinsurance=_D("0.30"),
+                 retail_30day_max_per_fill=_D("350"),
+                 mail_90day_available=False),
+        ),
+        step_therapy=(
+            _new(
+                StepTherapyRule,
                 drug_class="proton_pump_inhibitors",
-                required_first_try=["omeprazole"],
-                override_criteria=["adverse_reaction", "contraindication", "therapeutic_failure"],
+                required_first_try=("omeprazole",),
+                override_criteria=_STD_STEP_OVERRIDES,
             ),
-            StepTherapyRule(
+            _new(
+                StepTherapyRule,
                 drug_class="statins",
-                required_first_try=["atorvastatin", "rosuvastatin"],
-                override_criteria=["adverse_reaction", "contraindication", "therapeutic_failure"],
+                required_first_try=("atorvastatin", "rosuvastatin"),
+                override_criteria=_STD_STEP_OVERRIDES,
             ),
-            StepTherapyRule(
+            _new(
+                StepTherapyRule,
                 drug_class="ssri_snri",
-                required_first_try=["sertraline", "escitalopram"],
-                override_criteria=["adverse_reaction", "contraindication", "therapeutic_failure"],
+                required_first_try=("sertraline", "escitalopram"),
+                override_criteria=_STD_STEP_OVERRIDES,
             ),
-            StepTherapyRule(
+            _new(
+                StepTherapyRule,
                 drug_class="tnf_inhibitors",
-                required_first_try=["adalimumab_biosimilar"],
-                override_criteria=["adverse_reaction", "contraindication", "therapeutic_failure"],
+                required_first_try=("adalimumab_biosimilar",),
+                override_criteria=_STD_STEP_OVERRIDES,
             ),
-            StepTherapyRule(
+            _new(
+                StepTherapyRule,
                 drug_class="glp1_agonists",
-                required_first_try=["metformin"],
-                override_criteria=["adverse_reaction", "contraindication", "therapeutic_failure"],
+                required_first_try=("metformin",),
+                override_criteria=_STD_STEP_OVERRIDES,
             ),
-            StepTherapyRule(
+            _new(
+                StepTherapyRule,
                 drug_class="adhd_stimulants",
-                required_first_try=["methylphenidate_generic"],
-                override_criteria=["adverse_reaction", "contraindication", "therapeutic_failure"],
+                required_first_try=("methylphenidate_generic",),
+                override_criteria=_STD_STEP_OVERRIDES,
             ),
-        ],
-        maintenance_med_rule=MaintenanceMedRule(
+        ),
+        maintenance_med_rule=_new(
+            MaintenanceMedRule,
             max_initial_retail_fills=2,
-            required_channels=["90day_retail", "mail_order"],
+            required_channels=frozenset({"90day_retail", "mail_order"}),
             penalty_description="Third+ 30-day retail fill covered at 50% of copay; excess does not count toward OOP",
             penalty_counts_toward_oop=False,
         ),
-        mandatory_generic=MandatoryGenericRule(
+        mandatory_generic=_new(
+            MandatoryGenericRule,
             enabled=True,
             member_pays_brand_copay=True,
             member_pays_cost_difference=True,
             cost_difference_counts_toward_oop=False,
             daw_exception_allowed=True,
         ),
-        formulary_transition=FormularyTransitionRule(
+        formulary_transition=_new(
+            FormularyTransitionRule,
             transition_supply_days=90,
             at_prior_tier_cost=True,
         ),
-        prior_auth_categories=[
+        prior_auth_categories=(
             "tier5_specialty",
             "glp1_weight_loss",
             "biologics_biosimilars",
             "growth_hormone",
             "opioids_above_90mme",
             "compounds_above_300",
-        ],
-    ),
-
-    # ------------------------------------------------------------------
-    # Dental  (§11)
-    # ------------------------------------------------------------------
-    dental=DentalBenefits(
-        deductible_individual=Decimal("75"),
-        deductible_family=Decimal("225"),
-        annual_max_per_member=Decimal("2500"),
-        services=[
-            DentalService(name="prophylaxis", dental_class=DentalClass.PREVENTIVE,
-                          coverage_pct=Decimal("1.0"), subject_to_deductible=False,
-                          frequency="2 per plan year"),
-            DentalService(name="periodic_oral_exam", dental_class=DentalClass.PREVENTIVE,
-                          coverage_pct=Decimal("1.0"), subject_to_deductible=False,
-                          frequency="2 per plan year"),
-            DentalService(name="bitewing_xrays", dental_class=DentalClass.PREVENTIVE,
-                          coverage_pct=Decimal("1.0"), subject_to_deductible=False,
-                          frequency="1 set per plan year"),
-            DentalService(name="full_mouth_xrays", dental_class=DentalClass.PREVENTIVE,
-                          coverage_pct=Decimal("1.0"), subject_to_deductible=False,
-                          frequency="1 set per 3 plan years"),
-            DentalService(name="fluoride_treatment", dental_class=DentalClass.PREVENTIVE,
-                          coverage_pct=Decimal("1.0"), subject_to_deductible=False,
-                          frequency="2 per plan year, age 18 and under"),
-            DentalService(name="sealants", dental_class=DentalClass.PREVENTIVE,
-                          coverage_pct=Decimal("1.0"), subject_to_deductible=False,
-                          frequency="per permanent molar, once per tooth per lifetime",
-                          notes="Age 6-16"),
-            DentalService(name="fillings", dental_class=DentalClass.BASIC,
-                          coverage_pct=Decimal("0.80"), subject_to_deductible=True,
-                          notes="Posterior composite limited to amalgam allowance"),
-            DentalService(name="simple_extractions", dental_class=DentalClass.BASIC,
-                          coverage_pct=Decimal("0.80"), subject_to_deductible=True),
-            DentalService(name="root_canal_anterior", dental_class=DentalClass.BASIC,
-                          coverage_pct=Decimal("0.80"), subject_to_deductible=True),
-            DentalService(name="root_canal_molar", dental_class=DentalClass.BASIC,
-                          coverage_pct=Decimal("0.80"), subject_to_deductible=True),
-            DentalService(name="perio_srp", dental_class=DentalClass.BASIC,
-                          coverage_pct=Decimal("0.80"), subject_to_deductible=True,
-                          frequency="1 per quadrant per 2 plan years"),
-            DentalService(name="crowns", dental_class=DentalClass.MAJOR,
-                          coverage_pct=Decimal("0.50"), subject_to_deductible=True,
-                          frequency="1 per tooth per 5 plan years"),
-            DentalService(name="bridges", dental_class=DentalClass.MAJOR,
-                          coverage_pct=Decimal("0.50"), subject_to_deductible=True),
-            DentalService(name="dentures", dental_class=DentalClass.MAJOR,
-                          coverage_pct=Decimal("0.50"), subject_to_deductible=True,
-                          frequency="1 per arch per 5 plan years"),
-            DentalService(name="implants", dental_class=DentalClass.MAJOR,
-                          coverage_pct=Decimal("0.50"), subject_to_deductible=True,
-                          notes="Max $2,000 per implant"),
-            DentalService(name="surgical_extractions", dental_class=DentalClass.MAJOR,
-                          coverage_pct=Decimal("0.50"), subject_to_deductible=True),
-        ],
-        waiting_periods=[
-            DentalWaitingPeriod(dental_class=DentalClass.PREVENTIVE, months=0),
-            DentalWaitingPeriod(dental_class=DentalClass.BASIC, months=6),
-            DentalWaitingPeriod(dental_class=DentalClass.MAJOR, months=12),
-        ],
-        missing_tooth_clause=MissingToothClause(
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Dental  (§11)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_dental() -> DentalBenefits:
+    return _new(
+        DentalBenefits,
+        deductible_individual=_D("75"),
+        deductible_family=_D("225"),
+        annual_max_per_member=_D("2500"),
+        services=(
+            _new(DentalService, name="prophylaxis", dental_class=DentalClass.PREVENTIVE,
+                 coverage_pct=_D("1.0"), subject_to_deductible=False,
+                 frequency="2 per plan year"),
+            _new(DentalService, name="periodic_oral_exam", dental_class=DentalClass.PREVENTIVE,
+                 coverage_pct=_D("1.0"), subject_to_deductible=False,
+                 frequency="2 per plan year"),
+            _new(DentalService, name="bitewing_xrays", dental_class=DentalClass.PREVENTIVE,
+                 coverage_pct=_D("1.0"), subject_to_deductible=False,
+                 frequency="1 set per plan year"),
+            _new(DentalService, name="full_mouth_xrays", dental_class=DentalClass.PREVENTIVE,
+                 coverage_pct=_D("1.0"), subject_to_deductible=False,
+                 frequency="1 set per 3 plan years"),
+            _new(DentalService, name="fluoride_treatment", dental_class=DentalClass.PREVENTIVE,
+                 coverage_pct=_D("1.0"), subject_to_deductible=False,
+                 frequency="2 per plan year, age 18 and under"),
+            _new(DentalService, name="sealants", dental_class=DentalClass.PREVENTIVE,
+                 coverage_pct=_D("1.0"), subject_to_deductible=False,
+                 frequency="per permanent molar, once per tooth per lifetime",
+                 notes="Age 6-16"),
+            _new(DentalService, name="fillings", dental_class=DentalClass.BASIC,
+                 coverage_pct=_D("0.80"), subject_to_deductible=True,
+                 notes="Posterior composite limited to amalgam allowance"),
+            _new(DentalService, name="simple_extractions", dental_class=DentalClass.BASIC,
+                 coverage_pct=_D("0.80"), subject_to_deductible=True),
+            _new(DentalService, name="root_canal_anterior", dental_class=DentalClass.BASIC,
+                 coverage_pct=_D("0.80"), subject_to_deductible=True),
+            _new(DentalService, name="root_canal_molar", dental_class=DentalClass.BASIC,
+                 coverage_pct=_D("0.80"), subject_to_deductible=True),
+            _new(DentalService, name="perio_srp", dental_class=DentalClass.BASIC,
+                 coverage_pct=_D("0.80"), subject_to_deductible=True,
+                 frequency="1 per quadrant per 2 plan years"),
+            _new(DentalService, name="crowns", dental_class=DentalClass.MAJOR,
+                 coverage_pct=_D("0.50"), subject_to_deductible=True,
+                 frequency="1 per tooth per 5 plan years"),
+            _new(DentalService, name="bridges", dental_class=DentalClass.MAJOR,
+                 coverage_pct=_D("0.50"), subject_to_deductible=True),
+            _new(DentalService, name="dentures", dental_class=DentalClass.MAJOR,
+                 coverage_pct=_D("0.50"), subject_to_deductible=True,
+                 frequency="1 per arch per 5 plan years"),
+            _new(DentalService, name="implants", dental_class=DentalClass.MAJOR,
+                 coverage_pct=_D("0.50"), subject_to_deductible=True,
+                 notes="Max $2,000 per implant"),
+            _new(DentalService, name="surgical_extractions", dental_class=DentalClass.MAJOR,
+                 coverage_pct=_D("0.50"), subject_to_deductible=True),
+        ),
+        waiting_periods=(
+            _new(DentalWaitingPeriod, dental_class=DentalClass.PREVENTIVE, months=0),
+            _new(DentalWaitingPeriod, dental_class=DentalClass.BASIC, months=6),
+            _new(DentalWaitingPeriod, dental_class=DentalClass.MAJOR, months=12),
+        ),
+        missing_tooth_clause=_new(
+            MissingToothClause,
             enabled=True,
             exception_extracted_after_effective=True,
             exception_prior_creditable_months=12,
         ),
-        orthodontia=Orthodontia(
-            coverage_pct=Decimal("0.50"),
-            lifetime_max=Decimal("2000"),
+        orthodontia=_new(
+            Orthodontia,
+            coverage_pct=_D("0.50"),
+            lifetime_max=_D("2000"),
             age_limit=19,
             adult_covered=False,
             waiting_period_months=12,
             subject_to_deductible=True,
         ),
-    ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Vision  (§12)
+# ---------------------------------------------------------------------------
 
-    # ------------------------------------------------------------------
-    # Vision  (§12)
-    # ------------------------------------------------------------------
-    vision=VisionBenefits(
-        exam_copay=Decimal("0"),
+@lru_cache(maxsize=1)
+def _build_vision() -> VisionBenefits:
+    return _new(
+        VisionBenefits,
+        exam_copay=_D("0"),
         exam_frequency_per_year=1,
-        hardware=VisionHardware(
-            frame_allowance=Decimal("175"),
+        hardware=_new(
+            VisionHardware,
+            frame_allowance=_D("175"),
             frame_frequency="1 per plan year",
-            lens_copay=Decimal("25"),
-            contact_allowance=Decimal("175"),
+            lens_copay=_D("25"),
+            contact_allowance=_D("175"),
             contact_in_lieu_of_glasses=True,
         ),
-        oon_exam_reimbursement=Decimal("50"),
-        oon_frame_reimbursement=Decimal("75"),
-    ),
+        oon_exam_reimbursement=_D("50"),
+        oon_frame_reimbursement=_D("75"),
+    )
 
-    # ------------------------------------------------------------------
-    # Rehab  (§13)
-    # ------------------------------------------------------------------
-    rehab=RehabBenefits(
-        copay=Decimal("45"),
+
+# ---------------------------------------------------------------------------
+# Rehab  (§13)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_rehab() -> RehabBenefits:
+    return _new(
+        RehabBenefits,
+        copay=_D("45"),
         subject_to_deductible=False,
-        visit_limits=[
-            VisitLimit(service="physical_therapy", max_visits=30, shared_with=["occupational_therapy"],
-                       notes="PT and OT share combined 60-visit limit"),
-            VisitLimit(service="occupational_therapy", max_visits=30, shared_with=["physical_therapy"],
-                       notes="PT and OT share combined 60-visit limit"),
-            VisitLimit(service="speech_therapy", max_visits=30),
-            VisitLimit(service="chiropractic", max_visits=20),
-            VisitLimit(service="cardiac_rehab", max_visits=36),
-            VisitLimit(service="pulmonary_rehab", max_visits=36),
-        ],
+        visit_limits=(
+            _new(VisitLimit, service="physical_therapy", max_visits=30, limit_group_id="pt_ot"),
+            _new(VisitLimit, service="occupational_therapy", max_visits=30, limit_group_id="pt_ot"),
+            _new(VisitLimit, service="speech_therapy", max_visits=30),
+            _new(VisitLimit, service="chiropractic", max_visits=20),
+            _new(VisitLimit, service="cardiac_rehab", max_visits=36),
+            _new(VisitLimit, service="pulmonary_rehab", max_visits=36),
+        ),
+        limit_groups=(
+            _new(VisitLimitGroup, group_id="pt_ot", max_visits=60),  # §13.2 combined PT/OT
+        ),
         aba_exempt_from_limits=True,
         aba_prior_auth_required=True,
-        extended_limit_conditions=["stroke", "traumatic_brain_injury"],
-    ),
-
-    # ------------------------------------------------------------------
-    # Prior authorization  (§10)
-    # ------------------------------------------------------------------
-    prior_authorization=PriorAuthorization(
-        required_services=[
+        extended_limit_conditions=("stroke", "traumatic_brain_injury"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Prior authorization  (§10)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_prior_authorization() -> PriorAuthorization:
+    return _new(
+        PriorAuthorization,
+        required_services=(
             "non_emergency_inpatient",
             "outpatient_surgery_select",
             "advanced_imaging_mri_ct_pet",
@@ -564,117 +740,140 @@ green_cross_policy = Policy(
             "transplant",
             "residential_treatment",
             "non_emergency_air_ambulance",
-        ],
-        penalty=PriorAuthPenalty(
+        ),
+        penalty=_new(
+            PriorAuthPenalty,
             in_network_member_held_harmless=True,
-            out_of_network_benefit_reduction=Decimal("0.25"),
+            out_of_network_benefit_reduction=_D("0.25"),
             penalty_counts_toward_oop=False,
         ),
         retrospective_window_hours=48,
-    ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Correspondence  (state-specific rules)
+# ---------------------------------------------------------------------------
 
-    # ------------------------------------------------------------------
-    # Correspondence  (state-specific rules)
-    # ------------------------------------------------------------------
-    correspondence=CorrespondenceRules(
+@lru_cache(maxsize=1)
+def _build_correspondence() -> CorrespondenceRules:
+    return _new(
+        CorrespondenceRules,
         default_pronoun_style="they/them",
-        state_rules=[
-            StateCorrespondenceRule(
+        state_rules=(
+            _new(
+                StateCorrespondenceRule,
                 state="CA",
                 requires_gender_neutral_language=True,
                 surprise_billing_notice_required=True,
                 balance_billing_protections=True,
-                required_disclosures=["independent_medical_review_rights"],
-                language_requirements=["Spanish", "Chinese", "Tagalog", "Vietnamese", "Korean"],
+                required_disclosures=frozenset({"independent_medical_review_rights"}),
+                language_requirements=frozenset({"Spanish", "Chinese", "Tagalog", "Vietnamese", "Korean"}),
             ),
-            StateCorrespondenceRule(
+            _new(
+                StateCorrespondenceRule,
                 state="NY",
                 requires_gender_neutral_language=True,
                 surprise_billing_notice_required=True,
                 balance_billing_protections=True,
-                required_disclosures=["external_appeal_rights", "utilization_review_agent_info"],
-                language_requirements=["Spanish", "Chinese", "Russian", "Bengali", "Haitian_Creole"],
+                required_disclosures=frozenset({"external_appeal_rights", "utilization_review_agent_info"}),
+                language_requirements=frozenset({"Spanish", "Chinese", "Russian", "Bengali", "Haitian_Creole"}),
             ),
-            StateCorrespondenceRule(
+            _new(
+                StateCorrespondenceRule,
                 state="TX",
                 requires_gender_neutral_language=False,
                 surprise_billing_notice_required=True,
                 balance_billing_protections=True,
-                required_disclosures=["mediation_rights"],
-                language_requirements=["Spanish"],
+                required_disclosures=frozenset({"mediation_rights"}),
+                language_requirements=frozenset({"Spanish"}),
             ),
-            StateCorrespondenceRule(
+            _new(
+                StateCorrespondenceRule,
                 state="FL",
                 requires_gender_neutral_language=False,
                 surprise_billing_notice_required=False,
                 balance_billing_protections=False,
-                required_disclosures=[],
-                language_requirements=["Spanish"],
+                required_disclosures=frozenset(),
+                language_requirements=frozenset({"Spanish"}),
             ),
-            StateCorrespondenceRule(
+            _new(
+                StateCorrespondenceRule,
                 state="IL",
                 requires_gender_neutral_language=True,
                 surprise_billing_notice_required=True,
                 balance_billing_protections=True,
-                required_disclosures=["network_adequacy_notice"],
-                language_requirements=["Spanish", "Polish"],
+                required_disclosures=frozenset({"network_adequacy_notice"}),
+                language_requirements=frozenset({"Spanish", "Polish"}),
             ),
-            StateCorrespondenceRule(
+            _new(
+                StateCorrespondenceRule,
                 state="OR",
                 requires_gender_neutral_language=True,
                 surprise_billing_notice_required=True,
                 balance_billing_protections=True,
-                required_disclosures=["non_binary_gender_marker_support"],
-                language_requirements=["Spanish", "Vietnamese", "Russian"],
+                required_disclosures=frozenset({"non_binary_gender_marker_support"}),
+                language_requirements=frozenset({"Spanish", "Vietnamese", "Russian"}),
             ),
-        ],
-        eob_required_fields=[
+        ),
+        eob_required_fields=frozenset({
             "claim_number", "date_of_service", "provider_name",
             "billed_amount", "allowed_amount", "plan_paid",
             "member_responsibility", "deductible_applied",
             "coinsurance_applied", "copay_applied",
             "remaining_deductible", "remaining_oop",
             "appeal_rights_notice",
-        ],
-        denial_letter_required_fields=[
+        }),
+        denial_letter_required_fields=frozenset({
             "denial_reason", "clinical_criteria_used",
             "appeal_instructions", "appeal_deadline",
             "external_review_rights", "contact_information",
             "member_rights_statement",
-        ],
-    ),
+        }),
+    )
+
 
-    # ------------------------------------------------------------------
-    # Claims & appeals  (§16)
-    # ------------------------------------------------------------------
-    claims_and_appeals=ClaimsAndAppeals(
+# ---------------------------------------------------------------------------
+# Claims & appeals  (§16)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_claims_and_appeals() -> ClaimsAndAppeals:
+    return _new(
+        ClaimsAndAppeals,
         oon_filing_deadline_days=365,
-        appeals_levels=[
-            AppealsLevel(
+        appeals_levels=(
+            _new(
+                AppealsLevel,
                 name="internal_appeal",
                 filing_deadline_days=180,
                 decision_deadline_days=30,    # pre-service
                 expedited_deadline_hours=72,
             ),
-            AppealsLevel(
+            _new(
+                AppealsLevel,
                 name="external_review",
                 filing_deadline_days=120,     # 4 months from L1 exhaustion
                 decision_deadline_days=45,
                 expedited_deadline_hours=72,
             ),
-        ],
-        member_rights=[
+        ),
+        member_rights=(
             "request_clinical_criteria",
             "submit_additional_documentation",
             "request_expedited_review",
             "appoint_authorized_representative",
-        ],
-    ),
+        ),
+    )
 
-    # ------------------------------------------------------------------
-    # Exclusions  (§14)
-    # ------------------------------------------------------------------
-    exclusions=[
+
+# ---------------------------------------------------------------------------
+# Exclusions  (§14)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _build_exclusions() -> frozenset[str]:
+    return frozenset({
         "cosmetic_surgery_non_reconstructive",
         "weight_loss_surgery_below_bmi_thresholds",
         "infertility_treatment_beyond_diagnostic",
@@ -691,81 +890,239 @@ green_cross_policy = Policy(
         "non_emergency_outside_us",
         "private_duty_nursing_unapproved",
         "acupuncture_non_chronic_lbp",
-    ],
+    })
+
+
+# ---------------------------------------------------------------------------
+# Special provisions  (§15)
+# ---------------------------------------------------------------------------
 
-    # ------------------------------------------------------------------
-    # Special provisions  (§15)
-    # ------------------------------------------------------------------
-    special_provisions=SpecialProvisions(
-        cob=COBRule(
+@lru_cache(maxsize=1)
+def _build_special_provisions() -> SpecialProvisions:
+    return _new(
+        SpecialProvisions,
+        cob=_new(
+            COBRule,
             dependent_rule="naic_birthday_rule",
             employee_primary_rule="employee_plan_is_primary",
         ),
-        travel_emergency=TravelEmergency(
+        travel_emergency=_new(
+            TravelEmergency,
             geographic_scope="worldwide",
             max_trip_days=60,
             cost_share_same_as="in_network_emergency",
-            repatriation_max=Decimal("25000"),
+            repatriation_max=_D("25000"),
             follow_up_requires_transfer=True,
         ),
         cobra_months_employee=18,
         cobra_months_dependent=36,
-        cobra_premium_pct=Decimal("1.02"),
+        cobra_premium_pct=_D("1.02"),
         grace_period_days=31,
-    ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Network quirks  (Appendix A)
+# ---------------------------------------------------------------------------
 
-    # ------------------------------------------------------------------
-    # Network quirks  (Appendix A)
-    # ------------------------------------------------------------------
-    network_quirks=[
-        NetworkQuirk(
+@lru_cache(maxsize=1)
+def _build_network_quirks() -> tuple[NetworkQuirk, ...]:
+    return (
+        _new(
+            NetworkQuirk,
             id="lab_work_trap",
             name="Lab Work Trap",
             description="In-network physicians may send lab work to out-of-network labs",
             risk="Member unexpectedly billed at OON rates for routine lab work",
-            affected_services=["laboratory"],
+            affected_services=frozenset({"laboratory"}),
         ),
-        NetworkQuirk(
+        _new(
+            NetworkQuirk,
             id="anesthesia_oon",
             name="Anesthesia Billing",
             description="Anesthesiologists at in-network facilities may be OON",
             risk="Balance billing for elective procedures with advance OON consent",
-            affected_services=["anesthesia", "surgery"],
+            affected_services=frozenset({"anesthesia", "surgery"}),
         ),
-        NetworkQuirk(
+        _new(
+            NetworkQuirk,
             id="facility_professional_split",
             name="Facility vs Professional Split",
             description="Hospital outpatient services generate two separate claims",
             risk="Member expects one cost share but receives two",
-            affected_services=["outpatient_hospital", "imaging"],
+            affected_services=frozenset({"outpatient_hospital", "imaging"}),
         ),
-        NetworkQuirk(
+        _new(
+            NetworkQuirk,
             id="observation_vs_inpatient",
             name="Observation vs Inpatient Status",
             description="Observation status uses outpatient benefits, not inpatient",
             risk="Higher cost sharing than expected; ER copay not waived",
-            affected_services=["emergency", "inpatient"],
+            affected_services=frozenset({"emergency", "inpatient"}),
         ),
-        NetworkQuirk(
+        _new(
+            NetworkQuirk,
             id="preventive_diagnostic_reclass",
             name="Preventive-to-Diagnostic Reclassification",
             description="Screening procedures reclassified as diagnostic based on findings",
             risk="$0 preventive visit becomes subject to deductible + coinsurance",
-            affected_services=["preventive_care", "colonoscopy"],
+            affected_services=frozenset({"preventive_care", "colonoscopy"}),
         ),
-        NetworkQuirk(
+        _new(
+            NetworkQuirk,
             id="telehealth_state_licensure",
             name="Telehealth Originating Site",
             description="Telehealth only covered when member is in provider's licensed state",
             risk="Claim denied when traveling out of state",
-            affected_services=["telehealth"],
+            affected_services=frozenset({"telehealth"}),
         ),
-        NetworkQuirk(
+        _new(
+            NetworkQuirk,
             id="er_followup_oon",
             name="Emergency Follow-Up at OON Facility",
             description="Post-stabilization follow-up at OON facility uses OON rates",
             risk="Member assumes all care at ER facility is at in-network rates",
-            affected_services=["emergency", "follow_up"],
+            affected_services=frozenset({"emergency", "follow_up"}),
         ),
-    ],
-)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Policy instance
+# ---------------------------------------------------------------------------
+
+_SECTIONS = {
+    "deductibles": _build_deductibles,
+    "oop_max": _build_oop_max,
+    "preventive_care": _build_preventive_care,
+    "primary_care": _build_primary_care,
+    "specialist_care": _build_specialist_care,
+    "emergency": _build_emergency,
+    "inpatient": _build_inpatient,
+    "mental_health": _build_mental_health,
+    "pharmacy": _build_pharmacy,
+    "dental": _build_dental,
+    "vision": _build_vision,
+    "rehab": _build_rehab,
+    "prior_authorization": _build_prior_authorization,
+    "correspondence": _build_correspondence,
+    "claims_and_appeals": _build_claims_and_appeals,
+    "exclusions": _build_exclusions,
+    "special_provisions": _build_special_provisions,
+    "network_quirks": _build_network_quirks,
+}
+
+
+@lru_cache(maxsize=1)
+def _build_policy() -> Policy:
+    return _new(
+        Policy,
+        plan_name="Green Cross PPO Select",
+        policy_number="GCX-2025-PPO-4417",
+        group_number="GCX-00382",
+        effective_date=_PLAN_YEAR_START,
+        plan_year_start=_PLAN_YEAR_START,
+        plan_year_end=_PLAN_YEAR_END,
+        plan_type=PlanType.PPO,
+        sbc_version="2025-R3",
+        base_policies=tuple(default_registry().all()),
+        **{name: build() for name, build in _SECTIONS.items()},
+    )
+
+
+# ---------------------------------------------------------------------------
+# (De)serialization
+# ---------------------------------------------------------------------------
+
+# One shared validator for every JSON / dict read path, e.g.
+# POLICY_ADAPTER.validate_json(raw) or POLICY_ADAPTER.dump_json(green_cross_policy).
+# Cheap to create: the schema is built on first use (defer_build).
+POLICY_ADAPTER: TypeAdapter[Policy] = TypeAdapter(Policy)
+
+
+# ---------------------------------------------------------------------------
+# Warm-start cache
+# ---------------------------------------------------------------------------
+
+_CACHE_PATH = Path(__file__).parent / "__pycache__" / "green_cross.policy.json"
+
+
+def _source_files() -> list[Path]:
+    """Every file the built Policy depends on: all of the policy package
+    (models, money, regulations, this module, ...) plus the statute JSONL."""
+    package = Path(__file__).parent
+    return [*sorted(package.glob("*.py")), DEFAULT_REGULATIONS_PATH]
+
+
+def _source_hash() -> str:
+    """Fingerprint of everything the built Policy depends on."""
+    h = hashlib.sha1(pydantic.VERSION.encode())
+    for path in _source_files():
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _read_cache(key: str, *, validated: bool) -> Policy | None:
+    # first line is "<source hash> <validated|trusted>", the rest is
+    # POLICY_ADAPTER.dump_json output
+    try:
+        header, _, payload = _CACHE_PATH.read_bytes().partition(b"\n")
+        cached_key, _, mode = header.decode().partition(" ")
+        if cached_key != key or (validated and mode != "validated"):
+            return None
+        return POLICY_ADAPTER.validate_json(payload)
+    except (OSError, ValueError):
+        # missing, truncated, or written by an incompatible version
+        return None
+
+
+def _write_cache(key: str, policy: Policy, *, validated: bool) -> None:
+    header = f"{key} {'validated' if validated else 'trusted'}\n"
+    # per-process temp name so concurrent writers never share a file; plain
+    # write_bytes so the cache gets the umask's mode like any other .pyc
+    tmp = _CACHE_PATH.with_name(f"{_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        _CACHE_PATH.parent.mkdir(exist_ok=True)
+        tmp.write_bytes(header.encode() + POLICY_ADAPTER.dump_json(policy))
+        os.replace(tmp, _CACHE_PATH)
+    except OSError:
+        # read-only install or full disk: keep working without the cache,
+        # and don't leave a partial temp file behind
+        with suppress(OSError):
+            tmp.unlink(missing_ok=True)
+
+
+def _load_policy() -> Policy:
+    key = _source_hash()
+    # A validating run only reuses a tree that a validating run built from
+    # this exact source (every policy module plus the JSONL; see
+    # _source_files), so the literal is still checked once per change;
+    # later test sessions and xdist workers then load it instead of
+    # rebuilding.
+    policy = _read_cache(key, validated=_VALIDATE)
+    if policy is None:
+        policy = _build_policy()
+        _write_cache(key, policy, validated=_VALIDATE)
+    return policy
+
+
+def __getattr__(name: str):
+    # PEP 562: build the Policy tree on first access rather than at import,
+    # so importers that never touch the data skip validating ~200 submodels.
+    if name == "green_cross_policy":
+        globals()[name] = _load_policy()
+        return globals()[name]
+    if name == "registry":
+        return default_registry()
+    if name in _SECTIONS:
+        # one section without building the rest, unless the full tree is loaded
+        policy = globals().get("green_cross_policy")
+        return getattr(policy, name) if policy is not None else _SECTIONS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    # Prebuild the warm-start cache, e.g. once before a parallel test run:
+    #   GREEN_CROSS_VALIDATE=1 python -m policy.green_cross
+    _load_policy()
@@ -8,50 +8,83 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
+from functools import cached_property
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 
 
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
 
-class NetworkStatus(str, Enum):
+class NetworkStatus(StrEnum):
     IN_NETWORK = "in_network"
     OUT_OF_NETWORK = "out_of_network"
 
 
-class DeductibleType(str, Enum):
+class DeductibleType(StrEnum):
     EMBEDDED = "embedded"          # individual cap within family
     NON_EMBEDDED = "non_embedded"  # full family must be met first
 
 
-class PlanType(str, Enum):
+class PlanType(StrEnum):
     PPO = "PPO"
     HMO = "HMO"
     EPO = "EPO"
     POS = "POS"
 
 
-class DentalClass(str, Enum):
+class DentalClass(StrEnum):
     PREVENTIVE = "I"
     BASIC = "II"
     MAJOR = "III"
 
 
-class Gender(str, Enum):
+class Gender(StrEnum):
     MALE = "M"
     FEMALE = "F"
     ALL = "all"
 
 
+# ---------------------------------------------------------------------------
+# Base model
+# ---------------------------------------------------------------------------
+
+class ContractModel(BaseModel):
+    """Common config for every contract model.
+
+    Contract data is read-only once built, and validators are only compiled
+    for model classes that actually get instantiated. Validation is strict
+    (no str→Decimal or list→tuple coercion, no unknown fields): contract
+    literals are already typed, and external input opts into lax mode
+    explicitly.
+
+    Pure leaf records (no nested models) are `@contract_leaf` dataclasses
+    instead: slotted, so no per-instance __dict__, but validated under the
+    same strict rules on every construction.
+    """
+    model_config = ConfigDict(defer_build=True, frozen=True, strict=True, extra="forbid")
+
+
+# A pydantic (not stdlib) dataclass: pydantic passes stdlib dataclass
+# instances through a model field unchecked, so a float copay in a stdlib
+# CostShare would reach every consumer. Frozen comes from the decorator.
+contract_leaf = dataclass(
+    slots=True,
+    frozen=True,
+    config=ConfigDict(defer_build=True, strict=True, extra="forbid"),
+)
+
+
 # ---------------------------------------------------------------------------
 # Foundational: regulatory authority references
 # ---------------------------------------------------------------------------
 
-class RegulatoryReference(BaseModel):
+@contract_leaf
+class RegulatoryReference:
     """Links a benefit or rule to its authorizing statute / regulation."""
     statute: str                          # e.g. "Mental Health Parity and Addiction Equity Act"
     citation: Optional[str] = None        # e.g. "29 USC § 1185a"
@@ -60,11 +93,11 @@ class RegulatoryReference(BaseModel):
     notes: Optional[str] = None
 
 
-class BasePolicy(BaseModel):
+class BasePolicy(ContractModel):
     """A foundational / parent policy that the plan inherits from."""
     id: str                               # e.g. "MHPAEA", "ACA-preventive", "NSA-2022"
     name: str
-    references: list[RegulatoryReference] = []
+    references: tuple[RegulatoryReference, ...] = ()
     description: Optional[str] = None
 
 
@@ -72,7 +105,8 @@ class BasePolicy(BaseModel):
 # Cost sharing primitives
 # ---------------------------------------------------------------------------
 
-class CostShare(BaseModel):
+@contract_leaf
+class CostShare:
     copay: Optional[Decimal] = None
     coinsurance: Optional[Decimal] = None   # 0.20 = 20%
     subject_to_deductible: bool = True
@@ -83,68 +117,87 @@ class CostShare(BaseModel):
 # Deductibles
 # ---------------------------------------------------------------------------
 
-class DeductibleTier(BaseModel):
+@contract_leaf
+class DeductibleTier:
     individual: Decimal
     family: Decimal
     type: DeductibleType
 
 
-class Deductibles(BaseModel):
+class Deductibles(ContractModel):
     in_network: DeductibleTier
     out_of_network: DeductibleTier
     cross_accumulation: bool = False        # False = independent accumulators
-    excluded_services: list[str] = []       # not subject to deductible
+    excluded_services: tuple[str, ...] = ()  # not subject to deductible
 
 
 # ---------------------------------------------------------------------------
 # Out-of-pocket maximum
 # ---------------------------------------------------------------------------
 
-class OOPMaxTier(BaseModel):
+@contract_leaf
+class OOPMaxTier:
     individual: Decimal
     family: Decimal
 
 
-class AccumulatorAdjustment(BaseModel):
+@contract_leaf
+class AccumulatorAdjustment:
     """Manufacturer copay assistance accumulation rules."""
     enabled: bool = False
     excluded_from_deductible: bool = False
     excluded_from_oop: bool = False
-    applies_to_tiers: list[int] = []        # Rx tiers affected
+    applies_to_tiers: tuple[int, ...] = ()  # Rx tiers affected
 
 
-class OutOfPocketMax(BaseModel):
+class OutOfPocketMax(ContractModel):
     in_network: OOPMaxTier
     out_of_network: OOPMaxTier
-    includes: list[str] = []
-    excludes: list[str] = []
+    includes: tuple[str, ...] = ()
+    excludes: tuple[str, ...] = ()
     accumulator_adjustment: AccumulatorAdjustment = AccumulatorAdjustment()
 
+    @cached_property
+    def includes_set(self) -> frozenset[str]:
+        return frozenset(self.includes)
+
+    @cached_property
+    def excludes_set(self) -> frozenset[str]:
+        return frozenset(self.excludes)
+
 
 # ---------------------------------------------------------------------------
 # Service benefits
 # ---------------------------------------------------------------------------
 
-class ServiceBenefit(BaseModel):
+class ServiceBenefit(ContractModel):
     name: str
     in_network: CostShare
     out_of_network: CostShare = CostShare(covered=False)
     prior_auth_required: bool = False
 
 
-class VisitLimit(BaseModel):
+@contract_leaf
+class VisitLimit:
     service: str
     max_visits: int
     period: str = "plan_year"
-    shared_with: list[str] = []             # other services sharing this pool
+    limit_group_id: Optional[str] = None  # see RehabBenefits.limit_group()
     notes: Optional[str] = None
 
 
+@contract_leaf
+class VisitLimitGroup:
+    """A visit cap shared by every VisitLimit with this group_id."""
+    group_id: str
+    max_visits: int
+
+
 # ---------------------------------------------------------------------------
 # Preventive care
 # ---------------------------------------------------------------------------
 
-class PreventiveService(BaseModel):
+class PreventiveService(ContractModel):
     name: str
     frequency_per_plan_year: Optional[int] = None
     frequency_description: str
@@ -155,27 +208,27 @@ class PreventiveService(BaseModel):
     notes: Optional[str] = None
 
 
-class PreventiveToDiagnosticRule(BaseModel):
+class PreventiveToDiagnosticRule(ContractModel):
     trigger: str
     preventive_portion_cost: Decimal = Decimal("0")
     diagnostic_portion: CostShare
 
 
-class PreventiveCare(BaseModel):
-    services: list[PreventiveService]
-    reclassification_rules: list[PreventiveToDiagnosticRule] = []
+class PreventiveCare(ContractModel):
+    services: tuple[PreventiveService, ...]
+    reclassification_rules: tuple[PreventiveToDiagnosticRule, ...] = ()
     oon_preventive_cost_share: CostShare = CostShare(
         coinsurance=Decimal("0.40"), subject_to_deductible=True,
     )
     split_billing_allowed: bool = True
-    base_policies: list[str] = []           # IDs of foundational policies
+    base_policies: tuple[str, ...] = ()  # IDs of foundational policies
 
 
 # ---------------------------------------------------------------------------
 # Emergency care
 # ---------------------------------------------------------------------------
 
-class ERBenefit(BaseModel):
+class ERBenefit(ContractModel):
     facility_copay: Decimal
     facility_coinsurance: Decimal
     physician_coinsurance: Decimal
@@ -187,7 +240,7 @@ class ERBenefit(BaseModel):
     post_stabilization_oon_applies: bool = True
 
 
-class AmbulanceBenefit(BaseModel):
+class AmbulanceBenefit(ContractModel):
     ground_copay: Decimal
     ground_coinsurance: Decimal
     air_copay: Decimal
@@ -196,31 +249,31 @@ class AmbulanceBenefit(BaseModel):
     non_emergency_prior_auth: bool = True
 
 
-class EmergencyCare(BaseModel):
+class EmergencyCare(ContractModel):
     er: ERBenefit
     urgent_care: ServiceBenefit
     ambulance: AmbulanceBenefit
-    base_policies: list[str] = []
+    base_policies: tuple[str, ...] = ()
 
 
 # ---------------------------------------------------------------------------
 # Inpatient care
 # ---------------------------------------------------------------------------
 
-class InpatientCostShare(BaseModel):
+class InpatientCostShare(ContractModel):
     facility_copay: Decimal
     facility_coinsurance: Decimal
     physician_coinsurance: Decimal
     subject_to_deductible: bool = True
 
 
-class ObservationStatus(BaseModel):
+class ObservationStatus(ContractModel):
     uses_outpatient_benefits: bool = True
     er_copay_waived: bool = False
     notes: str = ""
 
 
-class InpatientCare(BaseModel):
+class InpatientCare(ContractModel):
     in_network: InpatientCostShare
     out_of_network: InpatientCostShare
     prior_auth_required: bool = True
@@ -237,14 +290,14 @@ class InpatientCare(BaseModel):
     snf_in_network_days_per_year: int = 60
     snf_out_of_network_days_per_year: int = 30
 
-    base_policies: list[str] = []
+    base_policies: tuple[str, ...] = ()
 
 
 # ---------------------------------------------------------------------------
 # Mental health & substance use
 # ---------------------------------------------------------------------------
 
-class MentalHealthBenefits(BaseModel):
+class MentalHealthBenefits(ContractModel):
     outpatient_individual: ServiceBenefit
     outpatient_group: ServiceBenefit
     psychiatric_med_mgmt: ServiceBenefit
@@ -256,14 +309,15 @@ class MentalHealthBenefits(BaseModel):
     separate_day_limits: bool = False
     higher_cost_share_than_medical: bool = False
 
-    base_policies: list[str] = []
+    base_policies: tuple[str, ...] = ()
 
 
 # ---------------------------------------------------------------------------
 # Pharmacy
 # ---------------------------------------------------------------------------
 
-class RxTier(BaseModel):
+@contract_leaf
+class RxTier:
     tier: int
     name: str
     retail_30day_copay: Optional[Decimal] = None
@@ -274,20 +328,21 @@ class RxTier(BaseModel):
     mail_90day_available: bool = True
 
 
-class StepTherapyRule(BaseModel):
+@contract_leaf
+class StepTherapyRule:
     drug_class: str
-    required_first_try: list[str]
-    override_criteria: list[str]
+    required_first_try: tuple[str, ...]
+    override_criteria: frozenset[str]
 
 
-class MaintenanceMedRule(BaseModel):
+class MaintenanceMedRule(ContractModel):
     max_initial_retail_fills: int = 2
-    required_channels: list[str]
+    required_channels: frozenset[str]
     penalty_description: str
     penalty_counts_toward_oop: bool = False
 
 
-class MandatoryGenericRule(BaseModel):
+class MandatoryGenericRule(ContractModel):
     enabled: bool = True
     member_pays_brand_copay: bool = True
     member_pays_cost_difference: bool = True
@@ -295,25 +350,26 @@ class MandatoryGenericRule(BaseModel):
     daw_exception_allowed: bool = True
 
 
-class FormularyTransitionRule(BaseModel):
+class FormularyTransitionRule(ContractModel):
     transition_supply_days: int = 90
     at_prior_tier_cost: bool = True
 
 
-class PharmacyBenefits(BaseModel):
-    tiers: list[RxTier]
-    step_therapy: list[StepTherapyRule]
+class PharmacyBenefits(ContractModel):
+    tiers: tuple[RxTier, ...]
+    step_therapy: tuple[StepTherapyRule, ...]
     maintenance_med_rule: MaintenanceMedRule
     mandatory_generic: MandatoryGenericRule
     formulary_transition: FormularyTransitionRule
-    prior_auth_categories: list[str] = []
+    prior_auth_categories: tuple[str, ...] = ()
 
 
 # ---------------------------------------------------------------------------
 # Dental
 # ---------------------------------------------------------------------------
 
-class DentalService(BaseModel):
+@contract_leaf
+class DentalService:
     name: str
     dental_class: DentalClass
     coverage_pct: Decimal
@@ -322,18 +378,19 @@ class DentalService(BaseModel):
     notes: Optional[str] = None
 
 
-class DentalWaitingPeriod(BaseModel):
+@contract_leaf
+class DentalWaitingPeriod:
     dental_class: DentalClass
     months: int
 
 
-class MissingToothClause(BaseModel):
+class MissingToothClause(ContractModel):
     enabled: bool = True
     exception_extracted_after_effective: bool = True
     exception_prior_creditable_months: int = 12
 
 
-class Orthodontia(BaseModel):
+class Orthodontia(ContractModel):
     coverage_pct: Decimal
     lifetime_max: Decimal
     age_limit: Optional[int] = None
@@ -342,12 +399,12 @@ class Orthodontia(BaseModel):
     subject_to_deductible: bool = True
 
 
-class DentalBenefits(BaseModel):
+class DentalBenefits(ContractModel):
     deductible_individual: Decimal
     deductible_family: Decimal
     annual_max_per_member: Decimal
-    services: list[DentalService]
-    waiting_periods: list[DentalWaitingPeriod]
+    services: tuple[DentalService, ...]
+    waiting_periods: tuple[DentalWaitingPeriod, ...]
     missing_tooth_clause: MissingToothClause
     orthodontia: Orthodontia
 
@@ -356,7 +413,8 @@ class DentalBenefits(BaseModel):
 # Vision
 # ---------------------------------------------------------------------------
 
-class VisionHardware(BaseModel):
+@contract_leaf
+class VisionHardware:
     frame_allowance: Decimal
     frame_frequency: str
     lens_copay: Decimal
@@ -364,7 +422,7 @@ class VisionHardware(BaseModel):
     contact_in_lieu_of_glasses: bool = True
 
 
-class VisionBenefits(BaseModel):
+class VisionBenefits(ContractModel):
     exam_copay: Decimal
     exam_frequency_per_year: int = 1
     hardware: VisionHardware
@@ -376,27 +434,35 @@ class VisionBenefits(BaseModel):
 # Rehab / habilitation
 # ---------------------------------------------------------------------------
 
-class RehabBenefits(BaseModel):
+class RehabBenefits(ContractModel):
     copay: Decimal
     subject_to_deductible: bool = False
-    visit_limits: list[VisitLimit]
+    visit_limits: tuple[VisitLimit, ...]
+    limit_groups: tuple[VisitLimitGroup, ...] = ()
     aba_exempt_from_limits: bool = True
     aba_prior_auth_required: bool = True
-    extended_limit_conditions: list[str] = []
+    extended_limit_conditions: tuple[str, ...] = ()
+
+    @cached_property
+    def limit_groups_by_id(self) -> dict[str, VisitLimitGroup]:
+        return {group.group_id: group for group in self.limit_groups}
+
+    def limit_group(self, group_id: str) -> VisitLimitGroup:
+        return self.limit_groups_by_id[group_id]
 
 
 # ---------------------------------------------------------------------------
 # Prior authorization
 # ---------------------------------------------------------------------------
 
-class PriorAuthPenalty(BaseModel):
+class PriorAuthPenalty(ContractModel):
     in_network_member_held_harmless: bool = True
     out_of_network_benefit_reduction: Decimal   # 0.25 = 25%
     penalty_counts_toward_oop: bool = False
 
 
-class PriorAuthorization(BaseModel):
-    required_services: list[str]
+class PriorAuthorization(ContractModel):
+    required_services: tuple[str, ...]
     penalty: PriorAuthPenalty
     retrospective_window_hours: int = 48
 
@@ -405,50 +471,65 @@ class PriorAuthorization(BaseModel):
 # Correspondence & state rules
 # ---------------------------------------------------------------------------
 
-class StateCorrespondenceRule(BaseModel):
+@contract_leaf
+class StateCorrespondenceRule:
     state: str
     requires_gender_neutral_language: bool = False
     required_appeal_rights_verbiage: Optional[str] = None
     surprise_billing_notice_required: bool = False
-    required_disclosures: list[str] = []
-    language_requirements: list[str] = []
+    required_disclosures: frozenset[str] = frozenset()
+    language_requirements: frozenset[str] = frozenset()
     balance_billing_protections: bool = False
 
 
-class CorrespondenceRules(BaseModel):
+class CorrespondenceRules(ContractModel):
     default_pronoun_style: str = "they/them"
-    state_rules: list[StateCorrespondenceRule] = []
-    eob_required_fields: list[str] = []
-    denial_letter_required_fields: list[str] = []
+    state_rules: tuple[StateCorrespondenceRule, ...] = ()
+    eob_required_fields: frozenset[str] = frozenset()
+    denial_letter_required_fields: frozenset[str] = frozenset()
+
+    @cached_property
+    def by_state(self) -> dict[str, StateCorrespondenceRule]:
+        return {rule.state: rule for rule in self.state_rules}
+
+    def state_rule(self, state: str) -> StateCorrespondenceRule:
+        return self.by_state[state]
 
 
 # ---------------------------------------------------------------------------
 # Claims & appeals
 # ---------------------------------------------------------------------------
 
-class AppealsLevel(BaseModel):
+class AppealsLevel(ContractModel):
     name: str
     filing_deadline_days: int
     decision_deadline_days: int
     expedited_deadline_hours: Optional[int] = None
 
 
-class ClaimsAndAppeals(BaseModel):
+class ClaimsAndAppeals(ContractModel):
     oon_filing_deadline_days: int = 365
-    appeals_levels: list[AppealsLevel]
-    member_rights: list[str]
+    appeals_levels: tuple[AppealsLevel, ...]
+    member_rights: tuple[str, ...]
+
+    @cached_property
+    def by_name(self) -> dict[str, AppealsLevel]:
+        return {level.name: level for level in self.appeals_levels}
+
+    def level(self, name: str) -> AppealsLevel:
+        return self.by_name[name]
 
 
 # ---------------------------------------------------------------------------
 # Special provisions
 # ---------------------------------------------------------------------------
 
-class COBRule(BaseModel):
+class COBRule(ContractModel):
     dependent_rule: str         # "birthday_rule"
     employee_primary_rule: str
 
 
-class TravelEmergency(BaseModel):
+class TravelEmergency(ContractModel):
     geographic_scope: str
     max_trip_days: int
     cost_share_same_as: str
@@ -456,7 +537,7 @@ class TravelEmergency(BaseModel):
     follow_up_requires_transfer: bool = True
 
 
-class SpecialProvisions(BaseModel):
+class SpecialProvisions(ContractModel):
     cob: COBRule
     travel_emergency: TravelEmergency
     cobra_months_employee: int = 18
@@ -469,19 +550,19 @@ class SpecialProvisions(BaseModel):
 # Network quirks
 # ---------------------------------------------------------------------------
 
-class NetworkQuirk(BaseModel):
+class NetworkQuirk(ContractModel):
     id: str
     name: str
     description: str
     risk: str
-    affected_services: list[str]
+    affected_services: frozenset[str]
 
 
 # ---------------------------------------------------------------------------
 # Top-level policy
 # ---------------------------------------------------------------------------
 
-class Policy(BaseModel):
+class Policy(ContractModel):
     # metadata
     plan_name: str
     policy_number: str
@@ -493,7 +574,7 @@ class Policy(BaseModel):
     sbc_version: str
 
     # foundational policies this plan inherits / must comply with
-    base_policies: list[BasePolicy] = []
+    base_policies: tuple[BasePolicy, ...] = ()
 
     # financials
     deductibles: Deductibles
@@ -501,8 +582,8 @@ class Policy(BaseModel):
 
     # benefits
     preventive_care: PreventiveCare
-    primary_care: list[ServiceBenefit]
-    specialist_care: list[ServiceBenefit]
+    primary_care: tuple[ServiceBenefit, ...]
+    specialist_care: tuple[ServiceBenefit, ...]
     emergency: EmergencyCare
     inpatient: InpatientCare
     mental_health: MentalHealthBenefits
@@ -515,6 +596,18 @@ class Policy(BaseModel):
     prior_authorization: PriorAuthorization
     correspondence: CorrespondenceRules
     claims_and_appeals: ClaimsAndAppeals
-    exclusions: list[str]
+    exclusions: frozenset[str]
     special_provisions: SpecialProvisions
-    network_quirks: list[NetworkQuirk] = []
+    network_quirks: tuple[NetworkQuirk, ...] = ()
+
+    @cached_property
+    def quirks_by_service(self) -> dict[str, tuple[NetworkQuirk, ...]]:
+        """Service id → the network quirks that affect it, in quirk order."""
+        index: dict[str, list[NetworkQuirk]] = {}
+        for quirk in self.network_quirks:
+            for service in quirk.affected_services:
+                index.setdefault(service, []).append(quirk)
+        return {service: tuple(quirks) for service, quirks in index.items()}
+
+    def quirks_for(self, service: str) -> tuple[NetworkQuirk, ...]:
+        return self.quirks_by_service.get(service, ())
@@ -0,0 +1,40 @@
+"""Integer conversions for contract amounts and rates.
+
+Contract values are stored as Decimal dollars and Decimal rates so they read
+exactly like the source document. Calculators that accumulate many claims
+can convert once at the boundary and do their arithmetic in native ints.
+
+Usage:
+    to_cents(Decimal("1500"))        # → 150000
+    to_basis_points(Decimal("0.20")) # → 2000
+    to_dollars(150000)               # → Decimal("1500.00")
+    bp_to_rate(2000)                 # → Decimal("0.2000")
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+
+def to_cents(amount: Decimal) -> int:
+    """Dollar amount → integer cents. Refuses amounts with fractional cents."""
+    cents = amount * 100
+    if cents != cents.to_integral_value():
+        raise ValueError(f"{amount} is not a whole number of cents")
+    return int(cents)
+
+
+def to_basis_points(rate: Decimal) -> int:
+    """Rate (0.20 = 20%) → integer basis points (2000)."""
+    bp = rate * 10_000
+    if bp != bp.to_integral_value():
+        raise ValueError(f"{rate} is not a whole number of basis points")
+    return int(bp)
+
+
+def to_dollars(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def bp_to_rate(bp: int) -> Decimal:
+    return Decimal(bp).scaleb(-4)
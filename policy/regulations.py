@@ -5,6 +5,7 @@ inspectable with jq, and editable without touching Python code.
 
 Usage:
     registry = RegulatoryRegistry.from_jsonl("regulations/base_policies.jsonl")
+    registry = default_registry()           # same file, reloaded only when edited
     registry.get("MHPAEA")                  # → BasePolicy
     registry.governs("ACA")                 # → ["preventive_care", "oop_max"]
     registry.statutes_for("emergency")      # → ["NSA"]
@@ -15,44 +16,69 @@ Usage:
 from __future__ import annotations
 
 import json
-from datetime import date
+import sys
+from functools import lru_cache
 from pathlib import Path
 
-from policy.models import BasePolicy, RegulatoryReference
+from policy.models import BasePolicy
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup; stdlib json also parses bytes
+    _json_loads = json.loads
+
+DEFAULT_REGULATIONS_PATH = Path(__file__).parent.parent / "regulations" / "base_policies.jsonl"
 
 
 class RegulatoryRegistry:
     """Loads and indexes regulatory references from a JSONL file."""
 
+    __slots__ = ("_policies", "_governs", "_statutes_by_section")
+
     def __init__(self) -> None:
         self._policies: dict[str, BasePolicy] = {}
-        self._governs: dict[str, list[str]] = {}
+        self._governs: dict[str, tuple[str, ...]] = {}
+        self._statutes_by_section: dict[str, tuple[str, ...]] = {}  # reverse of _governs
 
     @classmethod
     def from_jsonl(cls, path: str | Path) -> RegulatoryRegistry:
-        reg = cls()
-        reg._load(Path(path))
-        return reg
-
-    def _load(self, path: Path) -> None:
-        for line in path.read_text().splitlines():
-            line = line.strip()
-            if not line or line.startswith("//") or line.startswith("#"):
-                continue
-
-            raw = json.loads(line)
-            governs = raw.pop("governs", [])
+        """Load a registry, reusing an earlier load of the same unchanged file.
 
-            refs = []
-            for r in raw.pop("references", []):
-                eff = r.get("effective_date")
-                if isinstance(eff, str):
-                    r["effective_date"] = date.fromisoformat(eff)
-                refs.append(RegulatoryReference(**r))
+        The result is shared between callers; treat it as read-only.
+        """
+        path = Path(path).resolve()
+        return _load_cached(cls, path, path.stat().st_mtime_ns)
 
-            bp = BasePolicy(references=refs, **raw)
-            self._policies[bp.id] = bp
-            self._governs[bp.id] = governs
+    def _load(self, path: Path) -> None:
+        with path.open("rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith((b"//", b"#")):
+                    continue
+
+                raw = _json_loads(line)
+                # parsed strings are fresh objects; intern the ids so lookups
+                # against the (already interned) literals in policy code hit the
+                # identity fast path
+                if isinstance(raw.get("id"), str):
+                    raw["id"] = sys.intern(raw["id"])
+                governs = tuple(sys.intern(s) for s in raw.pop("governs", ()))
+
+                # one pydantic-core call validates the statute and its nested
+                # references, parsing ISO effective_date strings on the way;
+                # lax mode because JSON gives lists where the strict models
+                # expect tuples
+                bp = BasePolicy.model_validate(raw, strict=False)
+                self._policies[bp.id] = bp
+                self._governs[bp.id] = governs
+
+        # built from the final _governs, so a statute listed twice is indexed
+        # by its last line only, the same one governs() reports
+        by_section: dict[str, list[str]] = {}
+        for statute_id, governs in self._governs.items():
+            for section_id in dict.fromkeys(governs):  # once per statute
+                by_section.setdefault(section_id, []).append(statute_id)
+        self._statutes_by_section = {k: tuple(v) for k, v in by_section.items()}
 
     # -- lookup --
 
@@ -70,29 +96,32 @@ class RegulatoryRegistry:
 
     def governs(self, statute_id: str) -> list[str]:
         """Section IDs governed by a statute."""
-        return list(self._governs.get(statute_id, []))
+        return list(self._governs.get(statute_id, ()))
 
     def statutes_for(self, section_id: str) -> list[str]:
         """Statute IDs that govern a section."""
-        return [sid for sid, sections in self._governs.items() if section_id in sections]
+        return list(self._statutes_by_section.get(section_id, ()))
 
     def base_policies_for(self, section_id: str) -> list[BasePolicy]:
         """BasePolicy objects that govern a section."""
-        return [self._policies[sid] for sid in self.statutes_for(section_id)]
+        return [self._policies[sid] for sid in self._statutes_by_section.get(section_id, ())]
 
     # -- validation --
 
     def validate(self) -> list[str]:
         """Return a list of issues found in the regulatory data."""
-        issues = []
+        issues: list[str] = []
+        append = issues.append
         for bp_id, bp in self._policies.items():
-            if not bp.references:
-                issues.append(f"{bp_id}: no regulatory references")
-            for ref in bp.references:
+            refs = bp.references
+            if not refs:
+                append(f"{bp_id}: no regulatory references")
+                continue
+            for ref in refs:
                 if not ref.statute:
-                    issues.append(f"{bp_id}: reference missing statute name")
+                    append(f"{bp_id}: reference missing statute name")
                 if not ref.citation:
-                    issues.append(f"{bp_id}: reference missing citation")
+                    append(f"{bp_id}: reference missing citation")
         return issues
 
     def __len__(self) -> int:
@@ -103,3 +132,22 @@ class RegulatoryRegistry:
 
     def __repr__(self) -> str:
         return f"RegulatoryRegistry({len(self)} statutes)"
+
+
+@lru_cache(maxsize=8)
+def _load_cached(cls: type[RegulatoryRegistry], path: Path, mtime_ns: int) -> RegulatoryRegistry:
+    # mtime_ns is only part of the key: an edited file misses the cache
+    reg = cls()
+    reg._load(path)
+    return reg
+
+
+def default_registry() -> RegulatoryRegistry:
+    """The registry for regulations/base_policies.jsonl.
+
+    Shared through from_jsonl's cache, so every policy module built on the
+    same statutes references the same BasePolicy objects instead of
+    re-parsing and re-validating them; an edited file is reloaded on the
+    next call.
+    """
+    return RegulatoryRegistry.from_jsonl(DEFAULT_REGULATIONS_PATH)
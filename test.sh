@@ -5,7 +5,12 @@ cd "$(dirname "$0")"
 
 if [ ! -d .venv ]; then
     python -m venv .venv
-    .venv/bin/pip install -q pydantic pytest
 fi
+# every run, so venvs created before a dependency was added pick it up
+.venv/bin/pip install -q pydantic pytest pytest-xdist
 
-PYTHONPATH=. .venv/bin/pytest tests/ "$@"
+# validate and cache the policy tree once, so test workers load it
+PYTHONPATH=. GREEN_CROSS_VALIDATE=1 .venv/bin/python -m policy.green_cross
+# test classes only read the shared policy; run them in parallel, one class
+# per worker so class-level setup stays on a single process
+PYTHONPATH=. .venv/bin/pytest -n auto --dist loadscope tests/ "$@"
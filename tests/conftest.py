@@ -1,9 +1,49 @@
+import os
+from types import SimpleNamespace
+
 import pytest
 
-from policy.green_cross import green_cross_policy
+# validate the hand-authored policy literal instead of trusting it; must be
+# set before policy.green_cross is imported
+os.environ.setdefault("GREEN_CROSS_VALIDATE", "1")
+
+from policy.green_cross import POLICY_ADAPTER, green_cross_policy  # noqa: E402
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def policy():
     """The Green Cross contract as source of truth for all verification tests."""
     return green_cross_policy
+
+
+@pytest.fixture(scope="session", autouse=True)
+def policy_unchanged(policy):
+    """The session-scoped policy is shared by every test. The tree is frozen
+    all the way down, but object.__setattr__ still gets past that, so check
+    after the run that no test mutated it in place."""
+    before = POLICY_ADAPTER.dump_json(policy)
+    yield
+    assert POLICY_ADAPTER.dump_json(policy) == before, "a test mutated the shared policy"
+
+
+@pytest.fixture(scope="session")
+def indexed_policy(policy):
+    """Lookup tables over the policy's collections, built once per session so
+    tests do a dict probe instead of scanning a list."""
+    dental_by_class = {}
+    for svc in policy.dental.services:
+        dental_by_class.setdefault(svc.dental_class, []).append(svc)
+    return SimpleNamespace(
+        preventive_by_name={s.name: s for s in policy.preventive_care.services},
+        reclassification_by_trigger={
+            r.trigger: r for r in policy.preventive_care.reclassification_rules
+        },
+        rehab_by_service={v.service: v for v in policy.rehab.visit_limits},
+        dental_by_class=dental_by_class,
+        waiting_by_class={w.dental_class: w for w in policy.dental.waiting_periods},
+        step_therapy_by_class={r.drug_class: r for r in policy.pharmacy.step_therapy},
+        tier_by_number={t.tier: t for t in policy.pharmacy.tiers},
+        primary_care_by_name={s.name: s for s in policy.primary_care},
+        state_by_code=policy.correspondence.by_state,
+        base_policy_ids=frozenset(bp.id for bp in policy.base_policies),
+    )
@@ -7,8 +7,19 @@ should be approved. Either direction causes harm.
 
 from decimal import Decimal
 
+import pytest
+
 from policy.models import DentalClass, Gender, NetworkStatus
 
+# Contract amounts asserted below, parsed once at import
+_ZERO = Decimal("0")
+_DIAG_COINS = Decimal("0.20")     # A.5 reclassified diagnostic portion
+_FULL = Decimal("1.0")            # §11 Class I
+_BASIC_PCT = Decimal("0.80")      # §11 Class II
+_MAJOR_PCT = Decimal("0.50")      # §11 Class III
+_ANNUAL_MAX = Decimal("2500")     # §11 dental annual max per member
+_ORTHO_MAX = Decimal("2000")      # §11 orthodontia lifetime max
+
 
 # ---------------------------------------------------------------------------
 # Preventive care — the reclassification trap
@@ -16,29 +27,23 @@ from policy.models import DentalClass, Gender, NetworkStatus
 
 class TestPreventiveCare:
 
-    def test_annual_cleanings_count(self, policy):
+    def test_annual_cleanings_count(self, indexed_policy):
         """Risk: System allows 3 cleanings → plan overpays. System allows 1 → member
         loses entitled benefit."""
-        cleaning = next(
-            s for s in policy.preventive_care.services if s.name == "dental_cleaning"
-        )
+        cleaning = indexed_policy.preventive_by_name["dental_cleaning"]
         assert cleaning.frequency_per_plan_year == 2
 
-    def test_mammogram_gender_restriction(self, policy):
+    def test_mammogram_gender_restriction(self, indexed_policy):
         """Risk: Mammogram offered to all genders → unnecessary utilization and cost.
         Or restricted incorrectly → eligible members denied screening."""
-        mammo = next(
-            s for s in policy.preventive_care.services if s.name == "screening_mammogram"
-        )
+        mammo = indexed_policy.preventive_by_name["screening_mammogram"]
         assert mammo.gender == Gender.FEMALE
         assert mammo.age_min == 40
 
-    def test_colonoscopy_age_threshold(self, policy):
+    def test_colonoscopy_age_threshold(self, indexed_policy):
         """Risk: Wrong age threshold → members under 45 not flagged for screening,
         or system denies eligible 45+ members."""
-        colon = next(
-            s for s in policy.preventive_care.services if s.name == "screening_colonoscopy"
-        )
+        colon = indexed_policy.preventive_by_name["screening_colonoscopy"]
         assert colon.age_min == 45
 
     def test_preventive_requires_in_network(self, policy):
@@ -52,22 +57,21 @@ class TestPreventiveCare:
         member loses $0 preventive benefit entirely."""
         assert policy.preventive_care.split_billing_allowed is True
 
-    def test_colonoscopy_reclassification_rule_exists(self, policy):
+    def test_colonoscopy_reclassification_rule_exists(self, indexed_policy):
         """Risk: No reclassification rule → polyp removal billed at $0 (plan overpays)
         or entire colonoscopy billed as diagnostic (member overcharged)."""
-        triggers = [r.trigger for r in policy.preventive_care.reclassification_rules]
+        triggers = indexed_policy.reclassification_by_trigger
         assert "polyp_removal_during_screening_colonoscopy" in triggers
 
-    def test_reclassified_diagnostic_portion_has_cost_share(self, policy):
+    def test_reclassified_diagnostic_portion_has_cost_share(self, indexed_policy):
         """Risk: Diagnostic portion at $0 → plan pays for procedures that should
         have member cost sharing."""
-        rule = next(
-            r for r in policy.preventive_care.reclassification_rules
-            if r.trigger == "polyp_removal_during_screening_colonoscopy"
-        )
-        assert rule.preventive_portion_cost == Decimal("0")
+        rule = indexed_policy.reclassification_by_trigger[
+            "polyp_removal_during_screening_colonoscopy"
+        ]
+        assert rule.preventive_portion_cost == _ZERO
         assert rule.diagnostic_portion.subject_to_deductible is True
-        assert rule.diagnostic_portion.coinsurance == Decimal("0.20")
+        assert rule.diagnostic_portion.coinsurance == _DIAG_COINS
 
 
 # ---------------------------------------------------------------------------
@@ -86,6 +90,13 @@ class TestObservationStatus:
         that should apply. Copay waiver is ONLY for true inpatient admission."""
         assert policy.inpatient.observation_status.er_copay_waived is False
 
+    def test_observation_quirk_flagged_for_inpatient(self, policy):
+        """Risk: Claims engine looks up quirks for an inpatient claim and misses
+        the observation trap → member is never warned about outpatient cost share."""
+        ids = {q.id for q in policy.quirks_for("inpatient")}
+        assert "observation_vs_inpatient" in ids
+        assert policy.quirks_for("not_a_service") == ()
+
 
 # ---------------------------------------------------------------------------
 # Visit limits and shared pools
@@ -93,28 +104,28 @@ class TestObservationStatus:
 
 class TestVisitLimits:
 
-    def test_pt_limit(self, policy):
-        pt = next(v for v in policy.rehab.visit_limits if v.service == "physical_therapy")
-        assert pt.max_visits == 30
+    @pytest.mark.parametrize("service, max_visits", [
+        ("physical_therapy", 30),
+        ("speech_therapy", 30),
+        ("chiropractic", 20),
+    ])
+    def test_visit_limit(self, indexed_policy, service, max_visits):
+        assert indexed_policy.rehab_by_service[service].max_visits == max_visits
 
-    def test_pt_ot_shared_pool(self, policy):
+    def test_pt_ot_shared_pool(self, policy, indexed_policy):
         """Risk: PT and OT tracked independently → member gets 30 PT + 30 OT = 60 total
         when contract allows 60 combined. Plan overpays."""
-        pt = next(v for v in policy.rehab.visit_limits if v.service == "physical_therapy")
-        ot = next(v for v in policy.rehab.visit_limits if v.service == "occupational_therapy")
-        assert "occupational_therapy" in pt.shared_with
-        assert "physical_therapy" in ot.shared_with
+        pt = indexed_policy.rehab_by_service["physical_therapy"]
+        ot = indexed_policy.rehab_by_service["occupational_therapy"]
+        assert pt.limit_group_id is not None
+        assert ot.limit_group_id == pt.limit_group_id
+        assert policy.rehab.limit_group(pt.limit_group_id).max_visits == 60
 
-    def test_speech_therapy_separate_limit(self, policy):
+    def test_speech_therapy_separate_limit(self, indexed_policy):
         """Risk: Speech therapy incorrectly shares pool with PT/OT → member loses
         entitled speech visits when PT/OT pool is exhausted."""
-        st = next(v for v in policy.rehab.visit_limits if v.service == "speech_therapy")
-        assert st.max_visits == 30
-        assert st.shared_with == []
-
-    def test_chiropractic_limit(self, policy):
-        chiro = next(v for v in policy.rehab.visit_limits if v.service == "chiropractic")
-        assert chiro.max_visits == 20
+        st = indexed_policy.rehab_by_service["speech_therapy"]
+        assert st.limit_group_id is None
 
     def test_aba_exempt_from_visit_limits(self, policy):
         """Risk: ABA subject to visit limits → violates state mandates for autism
@@ -128,39 +139,27 @@ class TestVisitLimits:
 
 class TestDentalBenefits:
 
-    def test_preventive_no_deductible(self, policy):
+    def test_preventive_no_deductible(self, indexed_policy):
         """Risk: Deductible applied to preventive dental → member charged for
         cleanings/exams that should be at 100%."""
-        preventive = [
-            s for s in policy.dental.services
-            if s.dental_class == DentalClass.PREVENTIVE
-        ]
-        for svc in preventive:
+        for svc in indexed_policy.dental_by_class[DentalClass.PREVENTIVE]:
             assert svc.subject_to_deductible is False
-            assert svc.coverage_pct == Decimal("1.0")
+            assert svc.coverage_pct == _FULL
 
-    def test_basic_coverage_at_80pct(self, policy):
-        basic = [
-            s for s in policy.dental.services
-            if s.dental_class == DentalClass.BASIC
-        ]
-        for svc in basic:
-            assert svc.coverage_pct == Decimal("0.80")
+    def test_basic_coverage_at_80pct(self, indexed_policy):
+        for svc in indexed_policy.dental_by_class[DentalClass.BASIC]:
+            assert svc.coverage_pct == _BASIC_PCT
             assert svc.subject_to_deductible is True
 
-    def test_major_coverage_at_50pct(self, policy):
-        major = [
-            s for s in policy.dental.services
-            if s.dental_class == DentalClass.MAJOR
-        ]
-        for svc in major:
-            assert svc.coverage_pct == Decimal("0.50")
+    def test_major_coverage_at_50pct(self, indexed_policy):
+        for svc in indexed_policy.dental_by_class[DentalClass.MAJOR]:
+            assert svc.coverage_pct == _MAJOR_PCT
             assert svc.subject_to_deductible is True
 
     def test_annual_max(self, policy):
         """Risk: Wrong annual max → plan overpays beyond $2500 or prematurely
         stops coverage before $2500."""
-        assert policy.dental.annual_max_per_member == Decimal("2500")
+        assert policy.dental.annual_max_per_member == _ANNUAL_MAX
 
     def test_missing_tooth_clause_enabled(self, policy):
         """Risk: Clause disabled → plan pays for replacement of teeth missing before
@@ -185,8 +184,8 @@ class TestDentalBenefits:
         """Risk: Ortho and dental share annual max → $2000 ortho lifetime consumed
         from $2500 dental annual, leaving only $500 for dental."""
         # Ortho has lifetime max; dental has annual max — they're separate pools
-        assert policy.dental.orthodontia.lifetime_max == Decimal("2000")
-        assert policy.dental.annual_max_per_member == Decimal("2500")
+        assert policy.dental.orthodontia.lifetime_max == _ORTHO_MAX
+        assert policy.dental.annual_max_per_member == _ANNUAL_MAX
 
 
 # ---------------------------------------------------------------------------
@@ -195,27 +194,18 @@ class TestDentalBenefits:
 
 class TestDentalWaitingPeriods:
 
-    def test_preventive_no_waiting(self, policy):
+    def test_preventive_no_waiting(self, indexed_policy):
         """Risk: Waiting period on preventive → new member can't get cleanings for
         6 months. Incorrect denial."""
-        wp = next(
-            w for w in policy.dental.waiting_periods
-            if w.dental_class == DentalClass.PREVENTIVE
-        )
+        wp = indexed_policy.waiting_by_class[DentalClass.PREVENTIVE]
         assert wp.months == 0
 
-    def test_basic_6_month_waiting(self, policy):
-        wp = next(
-            w for w in policy.dental.waiting_periods
-            if w.dental_class == DentalClass.BASIC
-        )
+    def test_basic_6_month_waiting(self, indexed_policy):
+        wp = indexed_policy.waiting_by_class[DentalClass.BASIC]
         assert wp.months == 6
 
-    def test_major_12_month_waiting(self, policy):
-        wp = next(
-            w for w in policy.dental.waiting_periods
-            if w.dental_class == DentalClass.MAJOR
-        )
+    def test_major_12_month_waiting(self, indexed_policy):
+        wp = indexed_policy.waiting_by_class[DentalClass.MAJOR]
         assert wp.months == 12
 
 
@@ -225,30 +215,26 @@ class TestDentalWaitingPeriods:
 
 class TestStepTherapy:
 
-    def test_ppi_requires_omeprazole_first(self, policy):
+    def test_ppi_requires_omeprazole_first(self, indexed_policy):
         """Risk: Step therapy not enforced → non-preferred PPI dispensed without
         trying generic → unnecessary cost."""
-        ppi = next(
-            s for s in policy.pharmacy.step_therapy
-            if s.drug_class == "proton_pump_inhibitors"
-        )
+        ppi = indexed_policy.step_therapy_by_class["proton_pump_inhibitors"]
         assert "omeprazole" in ppi.required_first_try
 
     def test_all_step_therapy_has_override_criteria(self, policy):
         """Risk: No override path → member stuck on ineffective drug with no escape.
         Every step therapy rule MUST have override criteria."""
-        for rule in policy.pharmacy.step_therapy:
-            assert len(rule.override_criteria) > 0, (
-                f"{rule.drug_class}: no override criteria defined"
-            )
+        missing = [r.drug_class for r in policy.pharmacy.step_therapy if not r.override_criteria]
+        assert not missing, f"no override criteria defined: {missing}"
 
     def test_override_criteria_include_adverse_reaction(self, policy):
         """Risk: Adverse reaction not an override → member forced to continue
         medication causing harm."""
-        for rule in policy.pharmacy.step_therapy:
-            assert "adverse_reaction" in rule.override_criteria, (
-                f"{rule.drug_class}: missing adverse_reaction override"
-            )
+        missing = [
+            r.drug_class for r in policy.pharmacy.step_therapy
+            if "adverse_reaction" not in r.override_criteria
+        ]
+        assert not missing, f"missing adverse_reaction override: {missing}"
 
 
 # ---------------------------------------------------------------------------
@@ -8,6 +8,29 @@ action, fines, and member complaints.
 
 import re
 
+import pytest
+
+# State threshold languages for translated member materials
+_CA_THRESHOLD = frozenset({"Spanish", "Chinese", "Tagalog", "Vietnamese", "Korean"})
+_NY_THRESHOLD = frozenset({"Spanish", "Chinese", "Russian", "Bengali", "Haitian_Creole"})
+
+# Fields every EOB / denial letter must carry, with the risk if one is absent
+_EOB_FIELDS = {
+    "remaining_deductible": "member cannot track progress toward deductible (ACA transparency)",
+    "remaining_oop": "member cannot track progress toward out-of-pocket max",
+    "appeal_rights_notice": "EOB without appeal rights notice (ERISA violation)",
+}
+_DENIAL_LETTER_FIELDS = {
+    "clinical_criteria_used": "member cannot prepare appeal (ERISA procedural violation)",
+    "appeal_deadline": "member misses filing window (ERISA violation)",
+    "external_review_rights": "member unaware of independent review rights (ACA/ERISA)",
+}
+
+
+def _missing_fields(required, present):
+    """One line per required field absent from `present`, with its risk."""
+    return [f"{name}: {risk}" for name, risk in required.items() if name not in present]
+
 
 # ---------------------------------------------------------------------------
 # Gendered language by state
@@ -20,48 +43,19 @@ class TestGenderedLanguage:
         gender-neutral language. Correspondence templates must default to neutral."""
         assert policy.correspondence.default_pronoun_style == "they/them"
 
-    def test_california_requires_neutral(self, policy):
-        """Risk: 'him/her' in CA correspondence → violation of CA Insurance Code
-        and Gender Recognition Act. Regulatory action."""
-        ca = next(
-            (s for s in policy.correspondence.state_rules if s.state == "CA"), None
-        )
-        assert ca is not None, "Missing CA state rules"
-        assert ca.requires_gender_neutral_language is True
-
-    def test_new_york_requires_neutral(self, policy):
-        ny = next(
-            (s for s in policy.correspondence.state_rules if s.state == "NY"), None
-        )
-        assert ny is not None, "Missing NY state rules"
-        assert ny.requires_gender_neutral_language is True
-
-    def test_oregon_requires_neutral(self, policy):
-        """Risk: OR explicitly supports non-binary gender markers. Using binary
-        pronouns violates OR insurance regulations."""
-        ore = next(
-            (s for s in policy.correspondence.state_rules if s.state == "OR"), None
-        )
-        assert ore is not None, "Missing OR state rules"
-        assert ore.requires_gender_neutral_language is True
-
-    def test_texas_does_not_require_neutral(self, policy):
-        """Risk: Applying gender-neutral language in TX where not required isn't a
-        violation, but incorrectly flagging TX as requiring it adds unnecessary
-        process burden."""
-        tx = next(
-            (s for s in policy.correspondence.state_rules if s.state == "TX"), None
-        )
-        assert tx is not None, "Missing TX state rules"
-        assert tx.requires_gender_neutral_language is False
-
-    def test_states_requiring_neutral_is_subset(self, policy):
-        """Verify that we have an explicit decision for every state in our rules —
-        no accidental None values."""
-        for state_rule in policy.correspondence.state_rules:
-            assert isinstance(state_rule.requires_gender_neutral_language, bool), (
-                f"State {state_rule.state}: gender_neutral_language must be explicitly True or False"
-            )
+    @pytest.mark.parametrize("state, expected", [
+        pytest.param("CA", True, id="CA-him-her-violates-ins-code-and-gender-recognition-act"),
+        pytest.param("NY", True, id="NY-binary-pronouns-violate-state-rules"),
+        pytest.param("OR", True, id="OR-binary-pronouns-violate-non-binary-marker-rules"),
+        pytest.param("TX", False, id="TX-needless-flag-adds-process-burden"),
+    ])
+    def test_state_neutral_language_requirement(self, indexed_policy, state, expected):
+        """Risk: A state's gender-neutral language flag differs from its law →
+        binary pronouns sent where they are prohibited, or needless process
+        where they are not."""
+        rule = indexed_policy.state_by_code.get(state)
+        assert rule is not None, f"Missing {state} state rules"
+        assert rule.requires_gender_neutral_language is expected
 
 
 # ---------------------------------------------------------------------------
@@ -70,36 +64,24 @@ class TestGenderedLanguage:
 
 class TestLanguageRequirements:
 
-    def test_california_spanish(self, policy):
+    def test_california_spanish(self, indexed_policy):
         """Risk: CA has the largest Spanish-speaking population. Missing Spanish
         translation → violation of CA Health & Safety Code § 1367.04."""
-        ca = next(s for s in policy.correspondence.state_rules if s.state == "CA")
+        ca = indexed_policy.state_by_code["CA"]
         assert "Spanish" in ca.language_requirements
 
-    def test_california_threshold_languages(self, policy):
+    def test_california_threshold_languages(self, indexed_policy):
         """Risk: CA requires translations in threshold languages. Missing any →
         regulatory non-compliance."""
-        ca = next(s for s in policy.correspondence.state_rules if s.state == "CA")
-        required = {"Spanish", "Chinese", "Tagalog", "Vietnamese", "Korean"}
-        actual = set(ca.language_requirements)
-        missing = required - actual
+        ca = indexed_policy.state_by_code["CA"]
+        missing = _CA_THRESHOLD - ca.language_requirements
         assert not missing, f"CA missing threshold languages: {missing}"
 
-    def test_new_york_threshold_languages(self, policy):
-        ny = next(s for s in policy.correspondence.state_rules if s.state == "NY")
-        required = {"Spanish", "Chinese", "Russian", "Bengali", "Haitian_Creole"}
-        actual = set(ny.language_requirements)
-        missing = required - actual
+    def test_new_york_threshold_languages(self, indexed_policy):
+        ny = indexed_policy.state_by_code["NY"]
+        missing = _NY_THRESHOLD - ny.language_requirements
         assert not missing, f"NY missing threshold languages: {missing}"
 
-    def test_every_state_has_spanish(self, policy):
-        """Risk: Spanish is the most common non-English language in the US.
-        Any state without Spanish translation creates access barriers."""
-        for state_rule in policy.correspondence.state_rules:
-            assert "Spanish" in state_rule.language_requirements, (
-                f"State {state_rule.state}: missing Spanish language requirement"
-            )
-
 
 # ---------------------------------------------------------------------------
 # Surprise billing notices
@@ -107,33 +89,17 @@ class TestLanguageRequirements:
 
 class TestSurpriseBillingNotices:
 
-    def test_ca_surprise_billing_notice(self, policy):
-        ca = next(s for s in policy.correspondence.state_rules if s.state == "CA")
-        assert ca.surprise_billing_notice_required is True
-
-    def test_ny_surprise_billing_notice(self, policy):
-        ny = next(s for s in policy.correspondence.state_rules if s.state == "NY")
-        assert ny.surprise_billing_notice_required is True
-
-    def test_fl_no_surprise_billing_notice(self, policy):
-        """Risk: Sending surprise billing notice in FL (not required) isn't harmful,
-        but marking it as required adds unnecessary compliance tracking."""
-        fl = next(s for s in policy.correspondence.state_rules if s.state == "FL")
-        assert fl.surprise_billing_notice_required is False
-
-    def test_balance_billing_protection_states(self, policy):
-        """Risk: States with balance billing protections require specific member
-        notifications. Missing → state regulatory action."""
-        protected = [
-            s for s in policy.correspondence.state_rules
-            if s.balance_billing_protections
-        ]
-        # Every protected state must also have surprise billing notice
-        for state_rule in protected:
-            assert state_rule.surprise_billing_notice_required, (
-                f"State {state_rule.state}: has balance billing protections but "
-                f"no surprise billing notice requirement"
-            )
+    @pytest.mark.parametrize("state, expected", [
+        pytest.param("CA", True, id="CA-missing-notice-draws-dmhc-action"),
+        pytest.param("NY", True, id="NY-missing-notice-draws-dfs-action"),
+        pytest.param("FL", False, id="FL-needless-flag-adds-compliance-tracking"),
+    ])
+    def test_state_surprise_billing_notice(self, indexed_policy, state, expected):
+        """Risk: A state's surprise billing notice flag differs from its law →
+        members lose a required notice, or a notice no law requires is tracked
+        as a compliance item."""
+        rule = indexed_policy.state_by_code[state]
+        assert rule.surprise_billing_notice_required is expected
 
 
 # ---------------------------------------------------------------------------
@@ -142,21 +108,52 @@ class TestSurpriseBillingNotices:
 
 class TestRequiredDisclosures:
 
-    def test_ca_independent_medical_review(self, policy):
-        """Risk: CA members not informed of IMR rights → DMHC enforcement action."""
-        ca = next(s for s in policy.correspondence.state_rules if s.state == "CA")
-        assert "independent_medical_review_rights" in ca.required_disclosures
+    @pytest.mark.parametrize("state, disclosure", [
+        pytest.param("CA", "independent_medical_review_rights",
+                     id="CA-imr-rights-unstated-draws-dmhc-enforcement"),
+        pytest.param("NY", "external_appeal_rights",
+                     id="NY-external-appeal-unstated-draws-dfs-enforcement"),
+        pytest.param("OR", "non_binary_gender_marker_support",
+                     id="OR-gender-marker-support-unstated-draws-oid-enforcement"),
+    ])
+    def test_state_required_disclosure(self, indexed_policy, state, disclosure):
+        """Risk: A state-mandated disclosure is missing from the state's rules →
+        members are not told of a right the state requires, and its regulator
+        takes enforcement action."""
+        rule = indexed_policy.state_by_code[state]
+        assert disclosure in rule.required_disclosures
 
-    def test_ny_external_appeal_rights(self, policy):
-        """Risk: NY members not informed of external appeal → DFS enforcement."""
-        ny = next(s for s in policy.correspondence.state_rules if s.state == "NY")
-        assert "external_appeal_rights" in ny.required_disclosures
 
-    def test_or_nonbinary_support(self, policy):
-        """Risk: OR requires support for non-binary gender markers. Missing
-        disclosure → OID enforcement action."""
-        ore = next(s for s in policy.correspondence.state_rules if s.state == "OR")
-        assert "non_binary_gender_marker_support" in ore.required_disclosures
+# ---------------------------------------------------------------------------
+# Invariants across every state
+# ---------------------------------------------------------------------------
+
+class TestStateRuleInvariants:
+
+    def test_state_rule_invariants(self, indexed_policy):
+        """Checked in one pass over the state rules, reporting every violation:
+
+        - Every state has an explicit gender-neutral decision — no accidental
+          None values.
+        - Risk: Spanish is the most common non-English language in the US. Any
+          state without Spanish translation creates access barriers.
+        - Risk: States with balance billing protections require specific member
+          notifications. Missing surprise billing notice → state regulatory action.
+        """
+        violations = []
+        for state, rule in indexed_policy.state_by_code.items():
+            if not isinstance(rule.requires_gender_neutral_language, bool):
+                violations.append(
+                    f"State {state}: gender_neutral_language must be explicitly True or False"
+                )
+            if "Spanish" not in rule.language_requirements:
+                violations.append(f"State {state}: missing Spanish language requirement")
+            if rule.balance_billing_protections and not rule.surprise_billing_notice_required:
+                violations.append(
+                    f"State {state}: has balance billing protections but "
+                    f"no surprise billing notice requirement"
+                )
+        assert not violations, "\n".join(violations)
 
 
 # ---------------------------------------------------------------------------
@@ -165,30 +162,16 @@ class TestRequiredDisclosures:
 
 class TestDocumentFields:
 
-    def test_eob_has_remaining_deductible(self, policy):
-        """Risk: EOB missing remaining deductible → member cannot track progress
-        toward deductible. ACA transparency violation."""
-        assert "remaining_deductible" in policy.correspondence.eob_required_fields
-
-    def test_eob_has_remaining_oop(self, policy):
-        """Risk: EOB missing remaining OOP → member cannot track progress toward
-        out-of-pocket max."""
-        assert "remaining_oop" in policy.correspondence.eob_required_fields
-
-    def test_eob_has_appeal_rights(self, policy):
-        """Risk: EOB without appeal rights notice → ERISA violation."""
-        assert "appeal_rights_notice" in policy.correspondence.eob_required_fields
-
-    def test_denial_letter_has_clinical_criteria(self, policy):
-        """Risk: Denial without clinical criteria → member cannot prepare appeal.
-        ERISA procedural violation."""
-        assert "clinical_criteria_used" in policy.correspondence.denial_letter_required_fields
-
-    def test_denial_letter_has_appeal_deadline(self, policy):
-        """Risk: No deadline stated → member misses filing window. ERISA violation."""
-        assert "appeal_deadline" in policy.correspondence.denial_letter_required_fields
-
-    def test_denial_letter_has_external_review_info(self, policy):
-        """Risk: No external review information → member unaware of independent
-        review rights. ACA/ERISA violation."""
-        assert "external_review_rights" in policy.correspondence.denial_letter_required_fields
+    def test_eob_required_fields_present(self, policy):
+        """Risk: EOB omits a federally required field → member loses information
+        ACA/ERISA guarantee. Per-field risks are in _EOB_FIELDS."""
+        missing = _missing_fields(_EOB_FIELDS, policy.correspondence.eob_required_fields)
+        assert not missing, "EOB missing:\n" + "\n".join(missing)
+
+    def test_denial_letter_required_fields_present(self, policy):
+        """Risk: Denial letter omits a required field → member cannot exercise
+        appeal rights. Per-field risks are in _DENIAL_LETTER_FIELDS."""
+        missing = _missing_fields(
+            _DENIAL_LETTER_FIELDS, policy.correspondence.denial_letter_required_fields
+        )
+        assert not missing, "Denial letter missing:\n" + "\n".join(missing)
@@ -5,9 +5,103 @@ If these fail, members are overcharged or the plan overpays.
 Each test documents the specific financial risk if the assertion is wrong.
 """
 
+from dataclasses import is_dataclass
 from decimal import Decimal
-
-from policy.models import DeductibleType
+from operator import attrgetter
+
+import pytest
+from pydantic import ValidationError
+from pydantic.dataclasses import is_pydantic_dataclass
+
+from policy import green_cross, models
+from policy.green_cross import POLICY_ADAPTER
+from policy.models import (
+    AccumulatorAdjustment,
+    CostShare,
+    DeductibleTier,
+    DeductibleType,
+    DentalClass,
+    DentalService,
+    RehabBenefits,
+    RxTier,
+    StepTherapyRule,
+    VisionHardware,
+)
+from policy.money import to_basis_points, to_cents
+
+
+# What does and does not accumulate toward the OOP max
+_OOP_INCLUDES = frozenset({"deductible", "copayments", "coinsurance"})
+_OOP_EXCLUDES = frozenset({"premiums", "balance_billed_charges", "prior_auth_penalties"})
+
+
+# Money leaves built with a non-Decimal amount; each must be rejected
+_BAD_MONEY_LEAVES = [
+    pytest.param(CostShare, {"copay": 0.45}, id="costshare-float-copay"),
+    pytest.param(CostShare, {"copay": "30"}, id="costshare-str-copay"),
+    pytest.param(CostShare, {"coinsurance": 0.2}, id="costshare-float-coinsurance"),
+    pytest.param(
+        DeductibleTier,
+        {"individual": "1500", "family": Decimal("3000"), "type": DeductibleType.EMBEDDED},
+        id="deductible-str-individual",
+    ),
+    pytest.param(
+        DeductibleTier,
+        {"individual": Decimal("1500"), "family": 3000.0, "type": DeductibleType.EMBEDDED},
+        id="deductible-float-family",
+    ),
+    pytest.param(RxTier, {"tier": 1, "name": "x", "retail_30day_copay": 30.0},
+                 id="rxtier-float-retail-copay"),
+    pytest.param(RxTier, {"tier": 1, "name": "x", "mail_90day_copay": "25"},
+                 id="rxtier-str-mail-copay"),
+    pytest.param(
+        VisionHardware,
+        {"frame_allowance": 175.0, "frame_frequency": "1 per plan year",
+         "lens_copay": Decimal("25"), "contact_allowance": Decimal("175")},
+        id="vision-float-frame-allowance",
+    ),
+    pytest.param(
+        DentalService,
+        {"name": "crowns", "dental_class": DentalClass.MAJOR,
+         "coverage_pct": 0.5, "subject_to_deductible": True},
+        id="dental-float-coverage-pct",
+    ),
+]
+
+# Leaf records built with a coercible but wrong container type
+_BAD_LEAF_SHAPES = [
+    pytest.param(AccumulatorAdjustment, {"applies_to_tiers": [3, 4]},
+                 id="accumulator-list-tiers"),
+    pytest.param(AccumulatorAdjustment, {"enabled": 1}, id="accumulator-int-enabled"),
+    pytest.param(
+        StepTherapyRule,
+        {"drug_class": "statins", "required_first_try": ("atorvastatin",),
+         "override_criteria": ["adverse_reaction"]},
+        id="step-therapy-list-overrides",
+    ),
+    pytest.param(
+        DentalService,
+        {"name": "crowns", "dental_class": "III",
+         "coverage_pct": Decimal("0.50"), "subject_to_deductible": True},
+        id="dental-str-class",
+    ),
+]
+
+
+# Decimal fields holding a rate (0.20 = 20%) rather than a dollar amount
+_RATE_FIELD_MARKERS = ("coinsurance", "_pct", "_reduction")
+
+
+def _decimals(value, field=None):
+    """Every Decimal anywhere in a model_dump() tree, with its field name."""
+    if isinstance(value, Decimal):
+        yield field, value
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            yield from _decimals(v, k)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _decimals(v, field)
 
 
 # ---------------------------------------------------------------------------
@@ -16,33 +110,26 @@ from policy.models import DeductibleType
 
 class TestDeductibles:
 
-    def test_in_network_individual(self, policy):
-        """Risk: Member charged wrong deductible → delayed access to benefits."""
-        assert policy.deductibles.in_network.individual == Decimal("1500")
-
-    def test_in_network_family(self, policy):
-        assert policy.deductibles.in_network.family == Decimal("3000")
-
-    def test_in_network_embedded(self, policy):
-        """Risk: Non-embedded applied to in-network → one family member must satisfy
-        full $3000 before plan pays, instead of individual $1500 cap."""
-        assert policy.deductibles.in_network.type == DeductibleType.EMBEDDED
-
-    def test_out_of_network_individual(self, policy):
-        assert policy.deductibles.out_of_network.individual == Decimal("3000")
-
-    def test_out_of_network_family(self, policy):
-        assert policy.deductibles.out_of_network.family == Decimal("6000")
-
-    def test_out_of_network_non_embedded(self, policy):
-        """Risk: Embedded applied to OON → plan pays prematurely before family
-        deductible is satisfied, creating actuarial exposure."""
-        assert policy.deductibles.out_of_network.type == DeductibleType.NON_EMBEDDED
-
-    def test_cross_accumulation_independent(self, policy):
-        """Risk: Cross-accumulation enabled → in-network spend reduces OON deductible,
-        inflating OON benefits beyond contracted terms."""
-        assert policy.deductibles.cross_accumulation is False
+    @pytest.mark.parametrize("field, expected", [
+        pytest.param("in_network.individual", Decimal("1500"),
+                     id="in-network-individual-delays-benefit-access"),
+        pytest.param("in_network.family", Decimal("3000"),
+                     id="in-network-family-delays-family-benefits"),
+        pytest.param("in_network.type", DeductibleType.EMBEDDED,
+                     id="in-network-non-embedded-makes-one-member-meet-family-3000"),
+        pytest.param("out_of_network.individual", Decimal("3000"),
+                     id="oon-individual-delays-oon-benefits"),
+        pytest.param("out_of_network.family", Decimal("6000"),
+                     id="oon-family-delays-oon-benefits"),
+        pytest.param("out_of_network.type", DeductibleType.NON_EMBEDDED,
+                     id="oon-embedded-pays-before-family-deductible-met"),
+        pytest.param("cross_accumulation", False,
+                     id="cross-accumulation-lets-in-network-spend-inflate-oon"),
+    ])
+    def test_contract_value(self, policy, field, expected):
+        """Risk: A deductible term differs from the contract → cost share is
+        computed against the wrong threshold."""
+        assert attrgetter(field)(policy.deductibles) == expected
 
     def test_embedded_individual_cap_within_family(self, policy):
         """Risk: Embedded deductible means no single member should exceed the individual
@@ -58,41 +145,32 @@ class TestDeductibles:
 
 class TestOOPMax:
 
-    def test_in_network_individual(self, policy):
-        assert policy.oop_max.in_network.individual == Decimal("4500")
-
-    def test_in_network_family(self, policy):
-        assert policy.oop_max.in_network.family == Decimal("9000")
-
-    def test_out_of_network_individual(self, policy):
-        assert policy.oop_max.out_of_network.individual == Decimal("9000")
-
-    def test_out_of_network_family(self, policy):
-        assert policy.oop_max.out_of_network.family == Decimal("18000")
-
-    def test_oop_includes_deductible(self, policy):
+    @pytest.mark.parametrize("field, expected", [
+        pytest.param("in_network.individual", Decimal("4500"),
+                     id="in-network-individual-cap-misstated"),
+        pytest.param("in_network.family", Decimal("9000"),
+                     id="in-network-family-cap-misstated"),
+        pytest.param("out_of_network.individual", Decimal("9000"),
+                     id="oon-individual-cap-misstated"),
+        pytest.param("out_of_network.family", Decimal("18000"),
+                     id="oon-family-cap-misstated"),
+    ])
+    def test_contract_value(self, policy, field, expected):
+        """Risk: OOP max above contract → member keeps paying past the
+        contracted cap; below it → plan pays 100% prematurely."""
+        assert attrgetter(field)(policy.oop_max) == expected
+
+    def test_oop_includes(self, policy):
         """Risk: Deductible not counting toward OOP → member pays deductible + full OOP,
         exceeding contracted maximum."""
-        assert "deductible" in policy.oop_max.includes
-
-    def test_oop_includes_copays(self, policy):
-        assert "copayments" in policy.oop_max.includes
+        missing = _OOP_INCLUDES - policy.oop_max.includes_set
+        assert not missing, f"OOP max does not include: {missing}"
 
-    def test_oop_includes_coinsurance(self, policy):
-        assert "coinsurance" in policy.oop_max.includes
-
-    def test_oop_excludes_premiums(self, policy):
-        """Risk: Premiums counting toward OOP → member hits max too soon → plan
-        pays 100% prematurely."""
-        assert "premiums" in policy.oop_max.excludes
-
-    def test_oop_excludes_balance_billing(self, policy):
-        assert "balance_billed_charges" in policy.oop_max.excludes
-
-    def test_oop_excludes_prior_auth_penalties(self, policy):
-        """Risk: Auth penalties counting toward OOP undermines the penalty's purpose
-        as a cost-control mechanism."""
-        assert "prior_auth_penalties" in policy.oop_max.excludes
+    def test_oop_excludes(self, policy):
+        """Risk: Premiums, balance bills or auth penalties counting toward OOP →
+        member hits max too soon → plan pays 100% prematurely."""
+        missing = _OOP_EXCLUDES - policy.oop_max.excludes_set
+        assert not missing, f"OOP max does not exclude: {missing}"
 
 
 # ---------------------------------------------------------------------------
@@ -173,32 +251,31 @@ class TestPriorAuthPenalties:
 
 class TestPharmacyFinancials:
 
-    def test_tier1_copay(self, policy):
-        t1 = next(t for t in policy.pharmacy.tiers if t.tier == 1)
-        assert t1.retail_30day_copay == Decimal("10")
-
-    def test_tier5_coinsurance_with_cap(self, policy):
-        """Risk: No per-fill cap on specialty → member exposure unbounded on
-        high-cost biologics ($10k+/fill)."""
-        t5 = next(t for t in policy.pharmacy.tiers if t.tier == 5)
-        assert t5.retail_30day_coinsurance == Decimal("0.30")
-        assert t5.retail_30day_max_per_fill == Decimal("350")
-
-    def test_tier5_no_mail_order(self, policy):
-        """Risk: Specialty drugs shipped via mail order without proper cold-chain
-        or monitoring → safety and financial exposure."""
-        t5 = next(t for t in policy.pharmacy.tiers if t.tier == 5)
-        assert t5.mail_90day_available is False
-
-    def test_maintenance_penalty_not_toward_oop(self, policy):
-        """Risk: Retail fill penalty counting toward OOP → member hits max sooner →
+    @pytest.mark.parametrize("tier, field, expected", [
+        pytest.param(1, "retail_30day_copay", Decimal("10"),
+                     id="tier1-copay-misprices-every-generic-fill"),
+        pytest.param(5, "retail_30day_coinsurance", Decimal("0.30"),
+                     id="tier5-coinsurance-misprices-specialty"),
+        pytest.param(5, "retail_30day_max_per_fill", Decimal("350"),
+                     id="tier5-no-cap-leaves-biologic-exposure-unbounded"),
+        pytest.param(5, "mail_90day_available", False,
+                     id="tier5-mail-order-skips-cold-chain-monitoring"),
+    ])
+    def test_tier_value(self, indexed_policy, tier, field, expected):
+        """Risk: An Rx tier term differs from the contract → every fill in that
+        tier is priced or routed wrong."""
+        assert getattr(indexed_policy.tier_by_number[tier], field) == expected
+
+    @pytest.mark.parametrize("field", [
+        pytest.param("maintenance_med_rule.penalty_counts_toward_oop",
+                     id="retail-fill-penalty-reaches-oop-max-early"),
+        pytest.param("mandatory_generic.cost_difference_counts_toward_oop",
+                     id="brand-cost-difference-removes-generic-incentive"),
+    ])
+    def test_not_toward_oop(self, policy, field):
+        """Risk: A pharmacy penalty counts toward OOP → member hits max sooner →
         plan pays 100% on all Rx prematurely."""
-        assert policy.pharmacy.maintenance_med_rule.penalty_counts_toward_oop is False
-
-    def test_generic_cost_difference_not_toward_oop(self, policy):
-        """Risk: Brand-vs-generic cost difference counts toward OOP → incentive
-        to request brand eliminated."""
-        assert policy.pharmacy.mandatory_generic.cost_difference_counts_toward_oop is False
+        assert attrgetter(field)(policy.pharmacy) is False
 
     def test_mail_order_discount_ratio(self, policy):
         """Risk: Mail order 90-day cost >= 3x retail 30-day → no incentive to use
@@ -209,3 +286,101 @@ class TestPharmacyFinancials:
                     f"Tier {tier.tier}: mail 90-day ({tier.mail_90day_copay}) should be "
                     f"less than 3x retail 30-day ({tier.retail_30day_copay * 3})"
                 )
+
+
+# ---------------------------------------------------------------------------
+# Integer conversion (cents / basis points)
+# ---------------------------------------------------------------------------
+
+class TestIntegerConversion:
+    """Calculators convert contract values to integer cents and basis points
+    once at the boundary. Every value must survive that conversion exactly."""
+
+    def test_deductible_in_cents(self, policy):
+        """Risk: $1500 read as 1500 cents → deductible treated as met after $15."""
+        assert to_cents(policy.deductibles.in_network.individual) == 150_000
+
+    def test_oop_max_in_cents(self, policy):
+        assert to_cents(policy.oop_max.in_network.family) == 900_000
+
+    def test_coinsurance_in_basis_points(self, policy):
+        assert to_basis_points(policy.emergency.er.facility_coinsurance) == 2_000
+
+    def test_no_sub_cent_values(self, policy):
+        """Risk: A fractional-cent amount is silently truncated by an integer
+        calculator → rounding drift on every claim it touches."""
+        for field, value in _decimals(policy.model_dump()):
+            if not field.endswith(_RATE_FIELD_MARKERS):
+                to_cents(value)
+
+    def test_no_fractional_basis_point_rates(self, policy):
+        """Risk: A rate finer than a basis point is truncated by an integer
+        calculator → the member's share is misstated on every claim."""
+        for field, value in _decimals(policy.model_dump()):
+            if field.endswith(_RATE_FIELD_MARKERS):
+                to_basis_points(value)
+
+
+# ---------------------------------------------------------------------------
+# Strict money fields
+# ---------------------------------------------------------------------------
+
+class TestStrictMoneyFields:
+    """Contract models are strict: money fields take Decimal and nothing else."""
+
+    def test_float_copay_rejected(self):
+        """Risk: A float copay is coerced silently → 0.1 becomes
+        0.1000000000000000055511151231257827 and every claim drifts."""
+        with pytest.raises(ValidationError):
+            RehabBenefits(copay=0.45, visit_limits=())
+
+    def test_string_copay_rejected(self):
+        with pytest.raises(ValidationError):
+            RehabBenefits(copay="45", visit_limits=())
+
+    @pytest.mark.parametrize("cls, fields", _BAD_MONEY_LEAVES)
+    def test_leaf_money_rejected(self, cls, fields):
+        """Risk: Leaf records carry most money fields (every CostShare copay,
+        the deductible tiers, the Rx tiers); one that coerces or passes
+        through a float/str lets it reach every claim calculation."""
+        with pytest.raises(ValidationError):
+            cls(**fields)
+
+    @pytest.mark.parametrize("validate", [True, False], ids=["validated", "trusted"])
+    @pytest.mark.parametrize("cls, fields", _BAD_MONEY_LEAVES)
+    def test_literal_money_rejected(self, monkeypatch, validate, cls, fields):
+        """Risk: The policy literal builds leaves through _new → a bad amount
+        typed into green_cross.py ships in either build mode."""
+        monkeypatch.setattr(green_cross, "_VALIDATE", validate)
+        with pytest.raises(ValidationError):
+            green_cross._new(cls, **fields)
+
+    @pytest.mark.parametrize("cls, fields", _BAD_LEAF_SHAPES)
+    def test_leaf_shape_rejected(self, cls, fields):
+        """Risk: A 1 accepted as True, a bare "III" as a dental class, or a
+        list where a set is expected → the record holds something other than
+        the contract value and lookups against it silently miss."""
+        with pytest.raises(ValidationError):
+            cls(**fields)
+
+    def test_unknown_field_rejected(self):
+        """Risk: A misspelled field is dropped silently → the contract value it
+        carried never reaches the model and the default applies instead."""
+        with pytest.raises(ValidationError):
+            RehabBenefits(copay=Decimal("45"), visit_limits=(), subject_to_deductable=True)
+
+    def test_leaf_records_validate(self):
+        """Risk: A leaf record is a stdlib dataclass → pydantic passes its
+        instances through strict models unchecked, float copays included."""
+        leaves = [
+            obj for obj in vars(models).values()
+            if isinstance(obj, type) and is_dataclass(obj)
+        ]
+        assert leaves
+        unchecked = [cls.__name__ for cls in leaves if not is_pydantic_dataclass(cls)]
+        assert not unchecked, f"stdlib dataclass leaves: {unchecked}"
+
+    def test_json_round_trip(self, policy):
+        """Risk: Strict mode rejects the plan's own JSON → the warm-start
+        cache and any JSON consumer fail to load it."""
+        assert POLICY_ADAPTER.validate_json(POLICY_ADAPTER.dump_json(policy)) == policy
@@ -0,0 +1,195 @@
+"""Tests for the machinery around the contract, not the contract itself.
+
+Risk category: SUITE INTEGRITY
+If these fail, the other suites may be checking a stale or mis-loaded policy
+and pass when the contract is wrong. They carry no contract risk of their
+own, so the explorer leaves this module out of the risk graph.
+"""
+
+import json
+import os
+import stat
+from datetime import date
+from pathlib import Path
+
+from policy import green_cross, regulations
+from policy.regulations import RegulatoryRegistry
+
+
+# ---------------------------------------------------------------------------
+# Shared policy tree
+# ---------------------------------------------------------------------------
+
+class TestFrozenTree:
+    """One policy instance is shared by the whole session, so nothing in it
+    may be changeable in place."""
+
+    def test_policy_hashable(self, policy):
+        """Risk: A dict or list inside a frozen model → any test can edit the
+        shared policy and every later test checks the edited contract."""
+        assert hash(policy) == hash(policy)
+
+
+# ---------------------------------------------------------------------------
+# Warm-start cache of the built policy
+# ---------------------------------------------------------------------------
+
+class TestWarmStartCache:
+    """The suite may load the policy from the __pycache__ JSON dump instead of
+    rebuilding it. The dump must never outlive the code that produced it."""
+
+    def test_cache_key_covers_policy_package(self):
+        """Risk: A module that shapes the tree (regulations.py, say) is left out
+        of the key → a regression there is hidden by a stale cached tree."""
+        hashed = {p.name for p in green_cross._source_files()}
+        package = {p.name for p in Path(green_cross.__file__).parent.glob("*.py")}
+        missing = (package | {"base_policies.jsonl"}) - hashed
+        assert not missing, f"Not in cache key: {missing}"
+
+    def test_failed_write_leaves_no_temp_file(self, policy, tmp_path, monkeypatch):
+        """Risk: A write that fails halfway leaves its temp file behind → every
+        failed run litters __pycache__ with another partial dump."""
+        monkeypatch.setattr(green_cross, "_CACHE_PATH", tmp_path / "policy.json")
+
+        def fail(*args):
+            raise OSError("disk full")
+        monkeypatch.setattr(green_cross.os, "replace", fail)
+        green_cross._write_cache("key", policy, validated=True)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cache_file_not_private(self, policy, tmp_path, monkeypatch):
+        """Risk: Cache created 0600 → other users of a shared checkout can't
+        read it and rebuild (or fail to replace it) on every run."""
+        path = tmp_path / "policy.json"
+        monkeypatch.setattr(green_cross, "_CACHE_PATH", path)
+        green_cross._write_cache("key", policy, validated=True)
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+        assert [p.name for p in tmp_path.iterdir()] == ["policy.json"]
+
+    def test_key_changes_with_any_source(self, tmp_path, monkeypatch):
+        """Risk: An edit to one source file leaves the key unchanged → the
+        suite keeps loading the tree the old code built."""
+        copies = []
+        for src in green_cross._source_files():
+            dst = tmp_path / src.name
+            dst.write_bytes(src.read_bytes())
+            copies.append(dst)
+        monkeypatch.setattr(green_cross, "_source_files", lambda: copies)
+        before = green_cross._source_hash()
+        (tmp_path / "regulations.py").write_text("# edited\n", encoding="utf-8")
+        assert green_cross._source_hash() != before
+
+    def test_validating_run_ignores_trusted_cache(self, policy, tmp_path, monkeypatch):
+        """Risk: A tree cached by an unvalidated build is reused by the test
+        suite → the literal's type errors are never checked."""
+        monkeypatch.setattr(green_cross, "_CACHE_PATH", tmp_path / "policy.json")
+        green_cross._write_cache("key", policy, validated=False)
+        assert green_cross._read_cache("key", validated=True) is None
+        assert green_cross._read_cache("key", validated=False) == policy
+
+    def test_stale_key_ignored(self, policy, tmp_path, monkeypatch):
+        """Risk: A dump written under an older key is still loaded → the
+        tests check the contract as it was, not as it is."""
+        monkeypatch.setattr(green_cross, "_CACHE_PATH", tmp_path / "policy.json")
+        green_cross._write_cache("old", policy, validated=True)
+        assert green_cross._read_cache("new", validated=True) is None
+
+
+# ---------------------------------------------------------------------------
+# Regulatory registry loaded from JSONL
+# ---------------------------------------------------------------------------
+
+def _statute_line(statute_id: str, governs: list[str]) -> str:
+    return json.dumps({
+        "id": statute_id,
+        "name": f"{statute_id} Act",
+        "description": "",
+        "references": [{"statute": f"{statute_id} Act", "citation": "1 USC § 1",
+                        "effective_date": "2020-01-01"}],
+        "governs": governs,
+    })
+
+
+def _write_registry(path: Path, *lines: str) -> None:
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+class TestRegulatoryRegistry:
+    """The registry is the single source for which statute governs which
+    section; the suite only sees it through the built policy."""
+
+    def test_statutes_for_in_file_order(self, tmp_path):
+        """Risk: A duplicate governs entry lists a statute twice, or statutes
+        come back out of file order → the explorer draws doubled edges."""
+        path = tmp_path / "regs.jsonl"
+        _write_registry(path,
+                        _statute_line("B", ["emergency"]),
+                        _statute_line("A", ["emergency", "emergency", "oop_max"]))
+        registry = RegulatoryRegistry.from_jsonl(path)
+        assert registry.statutes_for("emergency") == ["B", "A"]
+        assert registry.statutes_for("oop_max") == ["A"]
+        assert registry.statutes_for("dental") == []
+        assert [bp.id for bp in registry.base_policies_for("emergency")] == ["B", "A"]
+
+    def test_repeated_statute_last_line_wins(self, tmp_path):
+        """Risk: A statute listed twice keeps its first sections in the reverse
+        index → statutes_for and governs disagree on what it covers."""
+        path = tmp_path / "regs.jsonl"
+        _write_registry(path,
+                        _statute_line("A", ["emergency"]),
+                        _statute_line("A", ["dental"]))
+        registry = RegulatoryRegistry.from_jsonl(path)
+        assert registry.governs("A") == ["dental"]
+        assert registry.statutes_for("dental") == ["A"]
+        assert registry.statutes_for("emergency") == []
+
+    def test_governs_and_lookup(self, tmp_path):
+        """Risk: A comment line is parsed as a statute, or the ISO date is
+        left a string → loading the real JSONL fails or mis-types references."""
+        path = tmp_path / "regs.jsonl"
+        _write_registry(path,
+                        "# comment",
+                        "// comment",
+                        "",
+                        _statute_line("A", ["emergency", "oop_max"]))
+        registry = RegulatoryRegistry.from_jsonl(path)
+        assert registry.ids == ["A"]
+        assert "A" in registry and len(registry) == 1
+        assert registry.governs("A") == ["emergency", "oop_max"]
+        assert registry.governs("missing") == []
+        assert registry.get("A").references[0].effective_date == date(2020, 1, 1)
+        assert registry.validate() == []
+
+    def test_unchanged_file_shared(self, tmp_path):
+        """Risk: Each caller re-parses the file → policy modules built on the
+        same statutes hold different BasePolicy objects."""
+        path = tmp_path / "regs.jsonl"
+        _write_registry(path, _statute_line("A", ["emergency"]))
+        assert RegulatoryRegistry.from_jsonl(path) is RegulatoryRegistry.from_jsonl(path)
+
+    def test_edited_file_reloaded(self, tmp_path):
+        """Risk: The first load is kept for the life of the process → an edit
+        to the JSONL file is invisible until the interpreter restarts."""
+        path = tmp_path / "regs.jsonl"
+        _write_registry(path, _statute_line("A", ["emergency"]))
+        before = RegulatoryRegistry.from_jsonl(path)
+        _write_registry(path, _statute_line("B", ["emergency"]))
+        mtime_ns = path.stat().st_mtime_ns
+        os.utime(path, ns=(mtime_ns, mtime_ns + 1_000_000))  # coarse clocks
+        after = RegulatoryRegistry.from_jsonl(path)
+        assert before.statutes_for("emergency") == ["A"]
+        assert after.statutes_for("emergency") == ["B"]
+
+    def test_default_registry_follows_file(self, tmp_path, monkeypatch):
+        """Risk: default_registry() pins its first load → the policy keeps
+        citing the statutes the file listed when the process started."""
+        path = tmp_path / "regs.jsonl"
+        _write_registry(path, _statute_line("A", ["emergency"]))
+        monkeypatch.setattr(regulations, "DEFAULT_REGULATIONS_PATH", path)
+        assert regulations.default_registry().ids == ["A"]
+        _write_registry(path, _statute_line("B", ["emergency"]))
+        mtime_ns = path.stat().st_mtime_ns
+        os.utime(path, ns=(mtime_ns, mtime_ns + 1_000_000))
+        assert regulations.default_registry().ids == ["B"]
@@ -7,6 +7,9 @@ fines, lawsuits, regulatory action, and loss of certification.
 
 from decimal import Decimal
 
+# Foundational statutes every plan must trace back to
+_REQUIRED_BASE_POLICIES = frozenset({"ACA", "MHPAEA", "NSA", "NMHPA", "COBRA", "ERISA"})
+
 
 # ---------------------------------------------------------------------------
 # Mental Health Parity (MHPAEA)
@@ -32,10 +35,10 @@ class TestMentalHealthParity:
         violation under MHPAEA."""
         assert policy.mental_health.higher_cost_share_than_medical is False
 
-    def test_mh_copay_not_exceeding_medical_pcp(self, policy):
+    def test_mh_copay_not_exceeding_medical_pcp(self, policy, indexed_policy):
         """Risk: Therapy copay exceeds PCP visit copay → potential parity violation
         on financial requirements."""
-        pcp = next(s for s in policy.primary_care if s.name == "pcp_office_visit")
+        pcp = indexed_policy.primary_care_by_name["pcp_office_visit"]
         therapy = policy.mental_health.outpatient_individual
         assert therapy.in_network.copay <= pcp.in_network.copay
 
@@ -136,35 +139,25 @@ class TestClaimsAndAppeals:
 
     def test_internal_appeal_filing_window(self, policy):
         """Risk: Window < 180 days → ERISA violation on appeal rights."""
-        internal = next(
-            a for a in policy.claims_and_appeals.appeals_levels
-            if a.name == "internal_appeal"
-        )
+        internal = policy.claims_and_appeals.level("internal_appeal")
         assert internal.filing_deadline_days >= 180
 
     def test_internal_appeal_decision_timeline(self, policy):
         """Risk: Decision > 30 days for pre-service → ERISA violation."""
-        internal = next(
-            a for a in policy.claims_and_appeals.appeals_levels
-            if a.name == "internal_appeal"
-        )
+        internal = policy.claims_and_appeals.level("internal_appeal")
         assert internal.decision_deadline_days <= 30
 
     def test_expedited_review_available(self, policy):
         """Risk: No expedited review → ERISA violation for urgent/concurrent
         care situations."""
-        internal = next(
-            a for a in policy.claims_and_appeals.appeals_levels
-            if a.name == "internal_appeal"
-        )
+        internal = policy.claims_and_appeals.level("internal_appeal")
         assert internal.expedited_deadline_hours is not None
         assert internal.expedited_deadline_hours <= 72
 
     def test_external_review_available(self, policy):
         """Risk: No external review → ERISA/ACA violation. Member has no
         independent review path."""
-        external_names = [a.name for a in policy.claims_and_appeals.appeals_levels]
-        assert "external_review" in external_names
+        assert "external_review" in policy.claims_and_appeals.by_name
 
     def test_member_right_to_clinical_criteria(self, policy):
         """Risk: Criteria not disclosed → member cannot prepare meaningful
@@ -187,21 +180,17 @@ class TestRegulatoryTraceability:
 
     def test_all_base_policies_have_references(self, policy):
         """Risk: Base policy with no citation → unverifiable compliance claim."""
-        for bp in policy.base_policies:
-            assert len(bp.references) > 0, (
-                f"Base policy '{bp.id}' has no regulatory references"
-            )
+        missing = [bp.id for bp in policy.base_policies if not bp.references]
+        assert not missing, f"Base policies with no regulatory references: {missing}"
 
     def test_all_base_policies_have_statute(self, policy):
-        for bp in policy.base_policies:
-            for ref in bp.references:
-                assert ref.statute, (
-                    f"Base policy '{bp.id}' reference missing statute name"
-                )
+        missing = [
+            (bp.id, i) for bp in policy.base_policies
+            for i, ref in enumerate(bp.references) if not ref.statute
+        ]
+        assert not missing, f"References missing statute name: {missing}"
 
-    def test_required_base_policies_present(self, policy):
+    def test_required_base_policies_present(self, indexed_policy):
         """Risk: Missing foundational policy → entire compliance domain untested."""
-        ids = {bp.id for bp in policy.base_policies}
-        required = {"ACA", "MHPAEA", "NSA", "NMHPA", "COBRA", "ERISA"}
-        missing = required - ids
+        missing = _REQUIRED_BASE_POLICIES - indexed_policy.base_policy_ids
         assert not missing, f"Missing base policies: {missing}"